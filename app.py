@@ -8,18 +8,266 @@ and provides a beautiful web interface for browsing organized content.
 import os
 import sys
 import json
+import sqlite3
+import heapq
+import operator
 import argparse
+from array import array
 from pathlib import Path
-from flask import Flask, render_template, jsonify, request, send_from_directory
+from flask import Flask, render_template, request, send_from_directory, stream_with_context
 from flask_cors import CORS
+import orjson
 import subprocess
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 # Import consolidated core
 from core import FileNinjaCore
 from db_manager import DatabaseManager
 
+# Seconds between background refreshes of the /api/stats payload
+STATS_TTL = 10
+
+# File health thresholds for /api/stats
+LARGE_FILE_BYTES = 50 * 1024 * 1024  # >50MB
+OLD_FILE_SECONDS = 365 * 24 * 3600   # >1 year old
+
+# Seconds a cached /api/status payload stays valid
+STATUS_TTL = 1.0
+
+# Maximum number of unknown file names remembered by /api/open-file
+NAME_MISS_LIMIT = 1024
+
+# Seconds before the stats index is rebuilt from disk to pick up changes
+# made outside the watcher
+REINDEX_INTERVAL = 60
+
+
+def _dump_json(obj):
+    """Serialize obj to JSON bytes, encoding Path and other objects as str."""
+    return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _request_json():
+    """Decode the current request body with orjson; an empty body or any non-object gives {}."""
+    raw = request.get_data(cache=False)
+    data = orjson.loads(raw) if raw else None
+    return data if isinstance(data, dict) else {}
+
+
+def _iter_files(root):
+    """
+    Yield an os.DirEntry for every file under root.
+    
+    Uses an explicit scandir stack: DirEntry caches the file type from the
+    directory read, so no extra stat() or Path object is needed per entry.
+    """
+    stack = [root]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        yield entry
+                except OSError:
+                    continue
+
+
+class FileStatsIndex:
+    """
+    In-memory index of the files in the organized folder, stored as parallel arrays.
+    
+    Sizes, modification times, category ids and file type ids live in
+    contiguous arrays with one row per file; a path -> row dict lets watcher
+    events add, replace or drop a single file in O(1). Per-category and
+    per-type totals, the large file count and the organized count are kept up
+    to date as rows change, so building the stats payload never touches the disk.
+    """
+    
+    def __init__(self, type_of):
+        """Create an empty index; type_of maps a file name to its file type."""
+        self.type_of = type_of
+        self.lock = threading.Lock()
+        self.built_at = None
+        self._reset()
+    
+    def _reset(self):
+        """Drop every row and running total."""
+        self.paths = []
+        self.names = []
+        self.sizes = array('q')
+        self.mtimes = array('d')
+        self.category_ids = array('I')
+        self.type_ids = array('I')
+        self.organized = array('B')
+        self.rows = {}
+        
+        # Category id -> name, with running totals indexed the same way
+        self.category_names = []
+        self.category_lookup = {}
+        self.category_sizes = []
+        self.category_counts = []
+        
+        # File type id -> name and running totals, as for categories
+        self.type_names = []
+        self.type_lookup = {}
+        self.type_sizes = []
+        self.type_counts = []
+        
+        self.total_size = 0
+        self.large_count = 0
+        self.organized_count = 0
+    
+    def _category_id(self, category):
+        """Return the id for a category name, registering it if new."""
+        category_id = self.category_lookup.get(category)
+        if category_id is None:
+            category_id = len(self.category_names)
+            self.category_lookup[category] = category_id
+            self.category_names.append(category)
+            self.category_sizes.append(0)
+            self.category_counts.append(0)
+        return category_id
+    
+    def _type_id(self, name):
+        """Return the file type id for a file name, registering the type if new."""
+        file_type = self.type_of(name)
+        type_id = self.type_lookup.get(file_type)
+        if type_id is None:
+            type_id = len(self.type_names)
+            self.type_lookup[file_type] = type_id
+            self.type_names.append(file_type)
+            self.type_sizes.append(0)
+            self.type_counts.append(0)
+        return type_id
+    
+    def _append(self, path, name, size, mtime, category, organized):
+        """Add a row for a file that is not in the index yet."""
+        category_id = self._category_id(category)
+        type_id = self._type_id(name)
+        self.rows[path] = len(self.paths)
+        self.paths.append(path)
+        self.names.append(name)
+        self.sizes.append(size)
+        self.mtimes.append(mtime)
+        self.category_ids.append(category_id)
+        self.type_ids.append(type_id)
+        self.organized.append(1 if organized else 0)
+        
+        self.category_sizes[category_id] += size
+        self.category_counts[category_id] += 1
+        self.type_sizes[type_id] += size
+        self.type_counts[type_id] += 1
+        self.total_size += size
+        if size > LARGE_FILE_BYTES:
+            self.large_count += 1
+        if organized:
+            self.organized_count += 1
+    
+    def _remove_row(self, row):
+        """Remove a row by moving the last row into its place."""
+        category_id = self.category_ids[row]
+        type_id = self.type_ids[row]
+        size = self.sizes[row]
+        self.category_sizes[category_id] -= size
+        self.category_counts[category_id] -= 1
+        self.type_sizes[type_id] -= size
+        self.type_counts[type_id] -= 1
+        self.total_size -= size
+        if size > LARGE_FILE_BYTES:
+            self.large_count -= 1
+        if self.organized[row]:
+            self.organized_count -= 1
+        
+        columns = (self.paths, self.names, self.sizes, self.mtimes,
+                   self.category_ids, self.type_ids, self.organized)
+        last = len(self.paths) - 1
+        del self.rows[self.paths[row]]
+        if row != last:
+            for column in columns:
+                column[row] = column[last]
+            self.rows[self.paths[row]] = row
+        for column in columns:
+            column.pop()
+    
+    def rebuild(self, entries):
+        """Replace the contents with (path, name, size, mtime, category, organized) rows."""
+        with self.lock:
+            self._reset()
+            for entry in entries:
+                if entry[0] not in self.rows:
+                    self._append(*entry)
+            self.built_at = time.monotonic()
+    
+    def upsert(self, path, name, size, mtime, category, organized):
+        """Add a file or replace its existing row."""
+        with self.lock:
+            row = self.rows.get(path)
+            if row is not None:
+                self._remove_row(row)
+            self._append(path, name, size, mtime, category, organized)
+    
+    def remove(self, path):
+        """Drop a file from the index if it is present."""
+        with self.lock:
+            row = self.rows.get(path)
+            if row is not None:
+                self._remove_row(row)
+    
+    def is_stale(self):
+        """True if the index was never built or is due for a rebuild."""
+        return self.built_at is None or time.monotonic() - self.built_at > REINDEX_INTERVAL
+    
+    def summary(self, now):
+        """
+        Aggregate the indexed files.
+        
+        Returns a dict with 'categories' (name -> (size, count)), 'by_type'
+        (file type -> {'count', 'size'}), 'largest' (five largest files as
+        (size, mtime, name, category, path)), 'large_files', 'old_files',
+        'total_files', 'total_size' and 'organized_files'.
+        """
+        with self.lock:
+            old_cutoff = now - OLD_FILE_SECONDS
+            old_count = sum(1 for mtime in self.mtimes if mtime < old_cutoff)
+            
+            sizes = self.sizes
+            top_rows = heapq.nlargest(5, range(len(sizes)), key=sizes.__getitem__)
+            largest = [
+                (sizes[row], self.mtimes[row], self.names[row],
+                 self.category_names[self.category_ids[row]], self.paths[row])
+                for row in top_rows
+            ]
+            
+            categories = {
+                name: (self.category_sizes[category_id], self.category_counts[category_id])
+                for category_id, name in enumerate(self.category_names)
+                if self.category_counts[category_id]
+            }
+            by_type = {
+                name: {'count': self.type_counts[type_id], 'size': self.type_sizes[type_id]}
+                for type_id, name in enumerate(self.type_names)
+                if self.type_counts[type_id]
+            }
+            
+            return {
+                'categories': categories,
+                'by_type': by_type,
+                'largest': largest,
+                'large_files': self.large_count,
+                'old_files': old_count,
+                'total_files': len(sizes),
+                'total_size': self.total_size,
+                'organized_files': self.organized_count
+            }
+
 
 class FileNinjaApp:
     """Main FileNinja Application class."""
@@ -27,15 +275,450 @@ class FileNinjaApp:
     def __init__(self):
         """Initialize the FileNinja application."""
         self.core = FileNinjaCore()
-        self.db = DatabaseManager()
+        self.db = None  # One long-lived connection shared by all routes
+        self._ensure_db()
         self.flask_app = Flask(__name__)
         CORS(self.flask_app)  # Enable CORS for web interface
         
+        # Any remaining jsonify callers should emit compact output
+        self.flask_app.config['JSONIFY_PRETTYPRINT_REGULAR'] = False
+        if hasattr(self.flask_app, 'json'):
+            self.flask_app.json.compact = True
+        
+        # Resolved organized folder, refreshed when the core reloads its config
+        self._base_folder = None
+        self._base_exists = False
+        self._refresh_base_folder()
+        
+        # Serialized /api/status payload and when it was built
+        self._status_bytes = None
+        self._status_ts = 0.0
+        
+        # Bumped on every organized file; drives ETags for logs and recent files
+        self._move_seq = 0
+        self._boot_id = format(int(time.time()), 'x')
+        
+        # Per-directory file counts keyed by path: (mtime_ns, file_count, subdirs)
+        self._dir_counts = {}
+        
+        # File name -> path index for /api/open-file, built lazily
+        self._name_index = None
+        self._name_misses = set()
+        self._name_lock = threading.Lock()
+        
+        # Serialized /api/stats payload, refreshed in the background
+        self._stats_cache = None
+        self._stats_lock = threading.Lock()
+        self._stats_dirty = threading.Event()
+        self._stats_thread = None
+        self._stats_index = FileStatsIndex(self.core.get_file_type)
+        self._scan_pool = ThreadPoolExecutor(
+            max_workers=min(32, (os.cpu_count() or 4) * 4),
+            thread_name_prefix='fileninja-scan'
+        )
+        self.core.add_listener(self._on_core_event)
+        
         # Setup Flask routes
         self._setup_routes()
         
         print("🥷 FileNinja Application initialized")
     
+    def _json_response(self, obj, status=200):
+        """Serialize obj with orjson and wrap it in a Flask response."""
+        return self._bytes_response(_dump_json(obj), status)
+    
+    def _bytes_response(self, payload, status=200):
+        """Wrap already-serialized JSON bytes in a Flask response."""
+        return self.flask_app.response_class(payload, status=status, mimetype='application/json')
+    
+    def _refresh_base_folder(self):
+        """Cache the resolved organized folder and whether it exists."""
+        self._base_folder = self.core.base_folder.resolve()
+        self._base_exists = self._base_folder.exists()
+    
+    def _move_etag(self):
+        """Weak ETag that changes whenever a file is organized."""
+        return f'{self._boot_id}-{self._move_seq}'
+    
+    @staticmethod
+    def _with_etag(response, etag):
+        """Attach the move ETag and force clients to revalidate."""
+        response.set_etag(etag, weak=True)
+        response.headers['Cache-Control'] = 'no-cache'
+        return response
+    
+    def _not_modified(self, etag):
+        """Empty 304 response for clients that already hold etag."""
+        return self._with_etag(self.flask_app.response_class(status=304), etag)
+    
+    def _ensure_db(self):
+        """Return True if the shared database connection is usable, reconnecting if needed."""
+        if self.db is not None and self.db.connection is not None:
+            return True
+        try:
+            if self.db is None:
+                self.db = DatabaseManager()
+            else:
+                self.db.connect()
+            return True
+        except sqlite3.Error:
+            return False
+    
+    def _resolve_browse_path(self, path):
+        """Map a web path such as 'Organized_Files/Images' onto the organized folder."""
+        if path == 'Organized_Files':
+            clean_path = ''
+        elif path.startswith('Organized_Files/'):
+            clean_path = path[len('Organized_Files/'):]
+        else:
+            clean_path = path
+        return self._base_folder / clean_path if clean_path else self._base_folder
+    
+    def _count_files(self, path):
+        """
+        Count files below path.
+        
+        Each directory's listing is cached against its mtime, so unchanged
+        directories cost a single stat() instead of a full scandir().
+        """
+        total = 0
+        stack = [path]
+        while stack:
+            current = stack.pop()
+            try:
+                mtime_ns = os.stat(current).st_mtime_ns
+            except OSError:
+                continue
+            
+            cached = self._dir_counts.get(current)
+            if cached is None or cached[0] != mtime_ns:
+                file_count = 0
+                subdirs = []
+                try:
+                    with os.scandir(current) as it:
+                        for entry in it:
+                            try:
+                                if entry.is_dir(follow_symlinks=False):
+                                    subdirs.append(entry.path)
+                                elif entry.is_file():
+                                    file_count += 1
+                            except OSError:
+                                continue
+                except OSError:
+                    continue
+                cached = (mtime_ns, file_count, subdirs)
+                self._dir_counts[current] = cached
+            
+            total += cached[1]
+            stack.extend(cached[2])
+        return total
+    
+    def _scan_tree(self, root):
+        """
+        Collect index rows for every file under root, one pool job per top-level folder.
+        
+        Returns a list of (path, name, size, mtime, category, organized) tuples.
+        """
+        # A file counts as organized if its path contains an Organized_Files
+        # folder, which is decided per top-level folder rather than per file
+        root_organized = 'Organized_Files' in root
+        top_files = []
+        jobs = []
+        try:
+            it = os.scandir(root)
+        except FileNotFoundError:
+            self._base_exists = False
+            return []
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        organized = root_organized or entry.name == 'Organized_Files'
+                        jobs.append(self._scan_pool.submit(
+                            self._collect_rows, _iter_files(entry.path), organized
+                        ))
+                    elif entry.is_file(follow_symlinks=False):
+                        top_files.append(entry)
+                except OSError:
+                    continue
+        
+        rows = self._collect_rows(top_files, root_organized)
+        for job in jobs:
+            rows.extend(job.result())
+        return rows
+    
+    @staticmethod
+    def _collect_rows(entries, organized):
+        """
+        Turn an iterable of file DirEntry objects into stats index rows.
+        
+        organized says whether every entry lives under an Organized_Files folder.
+        """
+        rows = []
+        append = rows.append
+        basename = os.path.basename
+        last_parent = None
+        category = ''
+        
+        for entry in entries:
+            try:
+                st = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            
+            file_path = entry.path
+            name = entry.name
+            
+            # Entries arrive grouped by directory, so reuse the last category
+            parent = file_path[:-len(name) - 1]
+            if parent != last_parent:
+                last_parent = parent
+                category = basename(parent)
+            
+            append((file_path, name, st.st_size, st.st_mtime, category, organized))
+        return rows
+    
+    def _reindex(self):
+        """Rebuild the stats index from a walk of the organized folder."""
+        self._stats_index.rebuild(self._scan_tree(str(self._base_folder)))
+    
+    def _index_file(self, path):
+        """Add or refresh one file in the stats index after the core moved it."""
+        base = str(self._base_folder)
+        path = os.path.realpath(path)
+        if not path.startswith(base + os.sep):
+            return
+        try:
+            st = os.stat(path)
+        except OSError:
+            self._stats_index.remove(path)
+            return
+        
+        top_level = path[len(base) + 1:].split(os.sep, 1)[0]
+        organized = 'Organized_Files' in base or top_level == 'Organized_Files'
+        self._stats_index.upsert(
+            path, os.path.basename(path), st.st_size, st.st_mtime,
+            os.path.basename(os.path.dirname(path)), organized
+        )
+    
+    def _build_stats(self):
+        """Compute the enhanced statistics payload served by /api/stats."""
+        base_path = self._base_folder
+        
+        # Enhanced stats for real usefulness
+        enhanced_stats = {
+            'total_files': 0,
+            'total_size': 0,
+            'by_type': {},
+            'recent_activity': [],
+            'storage_by_category': {},
+            'largest_files': [],
+            'recently_accessed': [],
+            'file_health': {
+                'duplicates': 0,
+                'large_files': 0,
+                'old_files': 0
+            },
+            'ninja_score': 0,
+            'connection_info': {
+                'type': 'Local System',
+                'status': 'Active',
+                'location': str(base_path) if self._base_exists else 'Not Found'
+            },
+            'quick_wins': [],
+            'user_flow_step': 'initial'
+        }
+        
+        if self._base_exists:
+            # Served from the in-memory index; the disk is only walked when
+            # the index is missing or due for its periodic rebuild
+            if self._stats_index.is_stale():
+                self._reindex()
+            summary = self._stats_index.summary(time.time())
+            category_totals = summary['categories']
+            # Totals describe the files on disk, matching storage_by_category
+            enhanced_stats['total_files'] = summary['total_files']
+            enhanced_stats['total_size'] = summary['total_size']
+            enhanced_stats['by_type'] = summary['by_type']
+            enhanced_stats['file_health']['large_files'] = summary['large_files']
+            enhanced_stats['file_health']['old_files'] = summary['old_files']
+            total_files = summary['total_files']
+            organized_files = summary['organized_files']
+            
+            # Format storage by category (in MB)
+            for category, (size, count) in category_totals.items():
+                enhanced_stats['storage_by_category'][category] = {
+                    'size_mb': round(size / (1024 * 1024), 1),
+                    'size_bytes': size,
+                    'files': count
+                }
+            
+            # Top 5 largest files
+            enhanced_stats['largest_files'] = [
+                {
+                    'name': name,
+                    'size': size,
+                    'category': category,
+                    'path': file_path.replace('\\', '/'),
+                    'modified': mtime
+                }
+                for size, mtime, name, category, file_path in summary['largest']
+            ]
+            
+            # Ninja score calculation (0-100) with quick wins
+            if total_files > 0:
+                enhanced_stats['ninja_score'] = min(100, int((organized_files / total_files) * 100))
+            
+            # Generate quick wins for user engagement
+            quick_wins = []
+            if enhanced_stats['file_health']['large_files'] > 0:
+                quick_wins.append({
+                    'title': "Free up space",
+                    'description': f"Clean {enhanced_stats['file_health']['large_files']} large files",
+                    'action': 'cleanup_large',
+                    'impact': 'high',
+                    'time': '2 min'
+                })
+            
+            if enhanced_stats['ninja_score'] < 50:
+                quick_wins.append({
+                    'title': "Boost your score",
+                    'description': "Auto-organize unorganized files",
+                    'action': 'auto_organize',
+                    'impact': 'high',
+                    'time': '30 sec'
+                })
+            
+            if len(category_totals) == 0:
+                quick_wins.append({
+                    'title': "Get started",
+                    'description': "Drop files to organize them",
+                    'action': 'onboarding',
+                    'impact': 'medium',
+                    'time': '1 min'
+                })
+                enhanced_stats['user_flow_step'] = 'first_time'
+            
+            enhanced_stats['quick_wins'] = quick_wins[:3]  # Top 3 quick wins
+        
+        # Add database stats if available
+        if self._ensure_db():
+            try:
+                recent_files = self.db.get_file_logs(limit=5)
+                enhanced_stats['recent_activity'] = recent_files
+                
+                # Recently accessed (mock data for now)
+                enhanced_stats['recently_accessed'] = recent_files[:3]
+            except Exception:
+                enhanced_stats['recent_activity'] = []
+                enhanced_stats['recently_accessed'] = []
+        
+        return enhanced_stats
+    
+    def _refresh_stats(self):
+        """Recompute the stats payload and swap in the serialized bytes."""
+        payload = _dump_json(self._build_stats())
+        with self._stats_lock:
+            self._stats_cache = payload
+        return payload
+    
+    def _stats_refresher(self):
+        """Background loop keeping the cached stats payload fresh."""
+        while True:
+            self._stats_dirty.wait(STATS_TTL)
+            self._stats_dirty.clear()
+            try:
+                self._refresh_stats()
+            except Exception as e:
+                print(f"⚠️ Could not refresh stats: {e}")
+    
+    def _build_name_index(self):
+        """Map file names to paths for every file in the organized folder."""
+        index = {}
+        for entry in _iter_files(str(self._base_folder)):
+            index.setdefault(entry.name, entry.path)
+        return index
+    
+    def _find_organized_file(self, name):
+        """Locate a file by name in the organized folder, or return None."""
+        with self._name_lock:
+            if name in self._name_misses:
+                return None
+            built_now = self._name_index is None
+            if built_now:
+                self._name_index = self._build_name_index()
+            found = self._name_index.get(name)
+        
+        if found and os.path.isfile(found):
+            return found
+        
+        # Index is stale (file moved or added outside the watcher): rebuild
+        # once, unless it was just built by this lookup
+        if not built_now:
+            index = self._build_name_index()
+            found = index.get(name)
+            with self._name_lock:
+                self._name_index = index
+        else:
+            found = None
+        
+        with self._name_lock:
+            if found is None:
+                if len(self._name_misses) >= NAME_MISS_LIMIT:
+                    self._name_misses.clear()
+                self._name_misses.add(name)
+        return found
+    
+    def _invalidate_status(self):
+        """Drop the cached /api/status payload."""
+        self._status_bytes = None
+    
+    def _invalidate_stats(self):
+        """Mark the cached stats payload as stale."""
+        if self._stats_thread is None:
+            # No refresher running: recompute on the next request
+            with self._stats_lock:
+                self._stats_cache = None
+        else:
+            self._stats_dirty.set()
+    
+    def _on_core_event(self, event, details):
+        """React to file moves and watcher changes reported by the core."""
+        self._invalidate_status()
+        if event in ('started', 'stopped'):
+            return
+        
+        self._move_seq += 1
+        
+        if event == 'config':
+            self._refresh_base_folder()
+            with self._name_lock:
+                self._name_index = None
+                self._name_misses.clear()
+            self._dir_counts.clear()
+            self._stats_index.built_at = None
+            self._invalidate_stats()
+        
+        elif event == 'moved':
+            dest = details.get('dest')
+            if dest:
+                with self._name_lock:
+                    name = os.path.basename(dest)
+                    if self._name_index is not None:
+                        self._name_index[name] = dest
+                    # Only a miss for this name can have been answered
+                    self._name_misses.discard(name)
+                self._index_file(dest)
+            source = details.get('source')
+            if source:
+                self._stats_index.remove(os.path.realpath(source))
+            self._invalidate_stats()
+        
+        elif event == 'logged':
+            # Batched log rows just became visible; the bumped sequence
+            # above already moves the /api/logs ETag on
+            self._invalidate_stats()
+    
     def _setup_routes(self):
         """Setup Flask web routes."""
         
@@ -49,217 +732,111 @@ class FileNinjaApp:
         def api_status():
             """Get system status."""
             try:
-                core_status = self.core.get_status()
-                db_status = self.db.get_connection_status() if hasattr(self.db, 'get_connection_status') else True
+                payload = self._status_bytes
+                if payload is None or time.monotonic() - self._status_ts >= STATUS_TTL:
+                    core_status = self.core.get_status()
+                    db_status = self._ensure_db()
+                    
+                    payload = _dump_json({
+                        'status': 'running' if core_status['is_running'] else 'stopped',
+                        'core': core_status,
+                        'database': 'connected' if db_status else 'disconnected'
+                    })
+                    self._status_bytes = payload
+                    self._status_ts = time.monotonic()
                 
-                return jsonify({
-                    'status': 'running' if core_status['is_running'] else 'stopped',
-                    'core': core_status,
-                    'database': 'connected' if db_status else 'disconnected'
-                })
+                return self._bytes_response(payload)
             except Exception as e:
-                return jsonify({'error': str(e)}), 500
+                return self._json_response({'error': str(e)}, 500)
         
         @self.flask_app.route('/api/stats')
         def api_stats():
             """Get enhanced file organization statistics."""
             try:
-                stats = self.core.get_organization_stats()
-                base_path = self.core.base_folder
-                
-                # Enhanced stats for real usefulness
-                enhanced_stats = {
-                    **stats,
-                    'storage_by_category': {},
-                    'largest_files': [],
-                    'recently_accessed': [],
-                    'file_health': {
-                        'duplicates': 0,
-                        'large_files': 0,
-                        'old_files': 0
-                    },
-                    'ninja_score': 0,
-                    'connection_info': {
-                        'type': 'Local System',
-                        'status': 'Active',
-                        'location': str(base_path) if base_path.exists() else 'Not Found'
-                    },
-                    'quick_wins': [],
-                    'user_flow_step': 'initial'
-                }
-                
-                if base_path.exists():
-                    all_files = list(base_path.rglob('*'))
-                    file_objects = [f for f in all_files if f.is_file()]
-                    
-                    # Storage by category
-                    category_sizes = {}
-                    largest_files = []
-                    # Storage by category
-                    for file_path in file_objects:
-                        try:
-                            size = file_path.stat().st_size
-                            category = file_path.parent.name
-                            
-                            # Category storage
-                            if category not in category_sizes:
-                                category_sizes[category] = 0
-                            category_sizes[category] += size
-                            
-                            # Largest files
-                            largest_files.append({
-                                'name': file_path.name,
-                                'size': size,
-                                'category': category,
-                                'path': str(file_path).replace('\\', '/'),
-                                'modified': file_path.stat().st_mtime
-                            })
-                            
-                            # File health checks
-                            if size > 50 * 1024 * 1024:  # >50MB
-                                enhanced_stats['file_health']['large_files'] += 1
-                            
-                            if (time.time() - file_path.stat().st_mtime) > (365 * 24 * 3600):  # >1 year old
-                                enhanced_stats['file_health']['old_files'] += 1
-                                
-                        except (OSError, PermissionError):
-                            continue
-                    
-                    # Format storage by category (in MB)
-                    for category, size in category_sizes.items():
-                        enhanced_stats['storage_by_category'][category] = {
-                            'size_mb': round(size / (1024 * 1024), 1),
-                            'size_bytes': size,
-                            'files': len([f for f in file_objects if f.parent.name == category])
-                        }
-                    
-                    # Top 5 largest files
-                    enhanced_stats['largest_files'] = sorted(
-                        largest_files, key=lambda x: x['size'], reverse=True
-                    )[:5]
-                    
-                    # Ninja score calculation (0-100) with quick wins
-                    total_files = len(file_objects)
-                    organized_files = len([f for f in file_objects if 'Organized_Files' in str(f)])
-                    if total_files > 0:
-                        enhanced_stats['ninja_score'] = min(100, int((organized_files / total_files) * 100))
-                    
-                    # Generate quick wins for user engagement
-                    quick_wins = []
-                    if enhanced_stats['file_health']['large_files'] > 0:
-                        quick_wins.append({
-                            'title': "Free up space",
-                            'description': f"Clean {enhanced_stats['file_health']['large_files']} large files",
-                            'action': 'cleanup_large',
-                            'impact': 'high',
-                            'time': '2 min'
-                        })
-                    
-                    if enhanced_stats['ninja_score'] < 50:
-                        quick_wins.append({
-                            'title': "Boost your score",
-                            'description': "Auto-organize unorganized files",
-                            'action': 'auto_organize',
-                            'impact': 'high',
-                            'time': '30 sec'
-                        })
-                    
-                    if len(category_sizes) == 0:
-                        quick_wins.append({
-                            'title': "Get started",
-                            'description': "Drop files to organize them",
-                            'action': 'onboarding',
-                            'impact': 'medium',
-                            'time': '1 min'
-                        })
-                        enhanced_stats['user_flow_step'] = 'first_time'
-                    
-                    enhanced_stats['quick_wins'] = quick_wins[:3]  # Top 3 quick wins
-                
-                # Add database stats if available
-                if self.db.connect():
-                    try:
-                        recent_files = self.db.get_file_logs(limit=5)
-                        enhanced_stats['recent_activity'] = recent_files
-                        
-                        # Recently accessed (mock data for now)
-                        enhanced_stats['recently_accessed'] = recent_files[:3]
-                    except Exception:
-                        enhanced_stats['recent_activity'] = []
-                        enhanced_stats['recently_accessed'] = []
+                with self._stats_lock:
+                    payload = self._stats_cache
+                if payload is None:
+                    payload = self._refresh_stats()
                 
-                return jsonify(enhanced_stats)
+                return self._bytes_response(payload)
             except Exception as e:
-                return jsonify({'error': str(e)}), 500
+                return self._json_response({'error': str(e)}, 500)
         
         @self.flask_app.route('/api/files')
         def api_files():
             """Get files in organized folders."""
             try:
-                path = request.args.get('path', 'Organized_Files')
-                base_path = self.core.base_folder
+                base_path = self._base_folder
+                full_path = self._resolve_browse_path(request.args.get('path', 'Organized_Files'))
                 
-                # Handle path navigation
-                if path != 'Organized_Files':
-                    # Remove 'Organized_Files/' prefix if present
-                    clean_path = path.replace('Organized_Files/', '').replace('Organized_Files', '')
-                    if clean_path:
-                        full_path = base_path / clean_path
-                    else:
-                        full_path = base_path
-                else:
-                    full_path = base_path
-                
-                if not full_path.exists():
-                    # Create the organized folder if it doesn't exist
+                if full_path == base_path:
+                    if not self._base_exists:
+                        # Create the organized folder if it doesn't exist
+                        full_path.mkdir(parents=True, exist_ok=True)
+                        self._base_exists = True
+                elif not full_path.exists():
                     full_path.mkdir(parents=True, exist_ok=True)
                 
-                files = []
-                folders = []
+                # Resolve the directory once instead of every file in it
+                resolved_dir = os.path.realpath(full_path)
+                relative_dir = str(full_path.relative_to(base_path)).replace('\\', '/')
+                folder_prefix = 'Organized_Files' if relative_dir == '.' else f"Organized_Files/{relative_dir}"
                 
-                for item in full_path.iterdir():
-                    if item.is_file():
-                        # Use forward slashes for JSON compatibility, convert in backend
-                        absolute_path = item.resolve()
-                        path_str = str(absolute_path).replace('\\', '/')
-                        files.append({
-                            'name': item.name,
-                            'path': path_str,
-                            'size': item.stat().st_size,
-                            'modified': item.stat().st_mtime,
-                            'extension': item.suffix.lower()
-                        })
-                    elif item.is_dir():
-                        folder_files = list(item.rglob('*'))
-                        file_count = len([f for f in folder_files if f.is_file()])
-                        # Format folder path for web navigation
-                        relative_folder_path = str(item.relative_to(base_path)).replace('\\', '/')
-                        folders.append({
-                            'name': item.name,
-                            'path': f"Organized_Files/{relative_folder_path}",
-                            'count': file_count
-                        })
+                # Open the listing up front so errors still produce a JSON error body
+                listing = os.scandir(full_path)
                 
-                return jsonify({
-                    'success': True,
-                    'files': files,
-                    'folders': folders,
-                    'current_path': str(full_path),
-                    'base_path': str(base_path)
-                })
+                def generate():
+                    """Stream the file list while the directory is being read."""
+                    folders = []
+                    separator = b''
+                    yield b'{"success":true,"files":['
+                    with listing as it:
+                        for entry in it:
+                            try:
+                                if entry.is_file():
+                                    st = entry.stat()
+                                    # Use forward slashes for JSON compatibility, convert in backend
+                                    path_str = os.path.join(resolved_dir, entry.name).replace('\\', '/')
+                                    yield separator + _dump_json({
+                                        'name': entry.name,
+                                        'path': path_str,
+                                        'size': st.st_size,
+                                        'modified': st.st_mtime,
+                                        'extension': os.path.splitext(entry.name)[1].lower()
+                                    })
+                                    separator = b','
+                                elif entry.is_dir():
+                                    file_count = self._count_files(entry.path)
+                                    # Format folder path for web navigation
+                                    folders.append({
+                                        'name': entry.name,
+                                        'path': f"{folder_prefix}/{entry.name}",
+                                        'count': file_count
+                                    })
+                            except OSError:
+                                continue
+                    
+                    yield (b'],"folders":' + _dump_json(folders)
+                           + b',"current_path":' + _dump_json(full_path)
+                           + b',"base_path":' + _dump_json(base_path) + b'}')
+                
+                return self.flask_app.response_class(
+                    stream_with_context(generate()),
+                    mimetype='application/json'
+                )
                 
             except Exception as e:
-                return jsonify({'success': False, 'error': str(e)})
+                return self._json_response({'success': False, 'error': str(e)})
         
         @self.flask_app.route('/api/open-file', methods=['POST'])
         def api_open_file():
             """Open a file with system default application."""
             try:
-                data = request.get_json()
+                data = _request_json()
                 file_path = data.get('path')
                 
                 if not file_path:
-                    return jsonify({'success': False, 'error': 'No file path provided'})
+                    return self._json_response({'success': False, 'error': 'No file path provided'})
                 
                 print(f"🔍 Received file path: {repr(file_path)}")  # Debug log
                 
@@ -275,15 +852,12 @@ class FileNinjaApp:
                 # Check if file exists
                 if not path_obj.exists():
                     # Try searching for the file in the organized folder
-                    base_path = self.core.base_folder
-                    print(f"🔍 File not found, searching in: {base_path}")
-                    for possible_file in base_path.rglob(path_obj.name):
-                        if possible_file.is_file():
-                            path_obj = possible_file
-                            print(f"✅ Found file at: {path_obj}")
-                            break
-                    else:
-                        return jsonify({'success': False, 'error': f'File not found: {path_obj}'})
+                    print(f"🔍 File not found, searching in: {self._base_folder}")
+                    found = self._find_organized_file(path_obj.name)
+                    if found is None:
+                        return self._json_response({'success': False, 'error': f'File not found: {path_obj}'})
+                    path_obj = Path(found)
+                    print(f"✅ Found file at: {path_obj}")
                 
                 # Convert back to string for subprocess
                 file_path_str = str(path_obj.resolve())
@@ -297,36 +871,44 @@ class FileNinjaApp:
                 else:  # Linux
                     subprocess.call(['xdg-open', file_path_str])
                 
-                return jsonify({'success': True, 'message': f'Opened: {path_obj.name}'})
+                return self._json_response({'success': True, 'message': f'Opened: {path_obj.name}'})
                 
             except Exception as e:
                 print(f"❌ Error opening file: {e}")  # Debug log
-                return jsonify({'success': False, 'error': f'Error opening file: {str(e)}'})
+                return self._json_response({'success': False, 'error': f'Error opening file: {str(e)}'})
         
         @self.flask_app.route('/api/logs')
         def api_logs():
             """Get file movement logs."""
             try:
+                etag = self._move_etag()
+                if request.if_none_match.contains_weak(etag):
+                    return self._not_modified(etag)
+                
                 logs = []
-                if self.db.connect():
+                if self._ensure_db():
                     try:
                         logs = self.db.get_file_logs(limit=50)
                     except Exception:
                         pass
 
-                return jsonify({'logs': logs})
+                return self._with_etag(self._json_response({'logs': logs}), etag)
 
             except Exception as e:
-                return jsonify({'error': str(e)}), 500
+                return self._json_response({'error': str(e)}, 500)
 
         @self.flask_app.route('/api/recent-files')
         def api_recent_files():
             """Get recent files for thumbnail display."""
             try:
+                etag = self._move_etag()
+                if request.if_none_match.contains_weak(etag):
+                    return self._not_modified(etag)
+                
                 recent_files = []
                 
                 # Try to get from database first
-                if self.db.connect():
+                if self._ensure_db():
                     try:
                         db_files = self.db.get_file_logs(limit=20)
                         for file_record in db_files:
@@ -335,7 +917,7 @@ class FileNinjaApp:
                                 if original_path and Path(original_path).exists():
                                     file_path = Path(original_path)
                                     recent_files.append({
-                                        'path': str(file_path),
+                                        'path': file_path,
                                         'name': file_path.name,
                                         'extension': file_path.suffix.lstrip('.'),
                                         'size': file_path.stat().st_size,
@@ -346,33 +928,38 @@ class FileNinjaApp:
                 
                 # Fallback: get files from organized folder
                 if not recent_files:
-                    base_path = self.core.base_folder
-                    if base_path.exists():
-                        all_files = list(base_path.rglob('*'))
-                        file_objects = [f for f in all_files if f.is_file()]
-                        file_objects.sort(key=lambda x: x.stat().st_mtime, reverse=True)
+                    base_path = self._base_folder
+                    if self._base_exists:
+                        def walked():
+                            for entry in _iter_files(str(base_path)):
+                                try:
+                                    st = entry.stat()
+                                except OSError:
+                                    continue
+                                yield entry.path, entry.name, st.st_size, st.st_mtime
                         
-                        for file_path in file_objects[:20]:
-                            try:
-                                recent_files.append({
-                                    'path': str(file_path),
-                                    'name': file_path.name,
-                                    'extension': file_path.suffix.lstrip('.'),
-                                    'size': file_path.stat().st_size,
-                                    'created_at': file_path.stat().st_mtime
-                                })
-                            except (OSError, PermissionError):
-                                continue
+                        # Keep only the 20 newest without sorting the whole tree
+                        newest = heapq.nlargest(20, walked(), key=operator.itemgetter(3))
+                        for file_path, name, size, mtime in newest:
+                            recent_files.append({
+                                'path': file_path,
+                                'name': name,
+                                'extension': os.path.splitext(name)[1].lstrip('.'),
+                                'size': size,
+                                'created_at': mtime
+                            })
 
-                return jsonify(recent_files)
+                return self._with_etag(self._json_response(recent_files), etag)
 
             except Exception as e:
                 print(f"Error in recent-files API: {e}")
-                return jsonify([])        @self.flask_app.route('/api/organize', methods=['POST'])
+                return self._json_response([])
+        
+        @self.flask_app.route('/api/organize', methods=['POST'])
         def api_organize():
             """Manually trigger organization of existing files."""
             try:
-                data = request.get_json() or {}
+                data = _request_json()
                 folder_path = data.get('folder')
                 
                 # Run organization in background thread
@@ -381,15 +968,32 @@ class FileNinjaApp:
                 
                 threading.Thread(target=organize_files, daemon=True).start()
                 
-                return jsonify({'success': True, 'message': 'Organization started'})
+                return self._json_response({'success': True, 'message': 'Organization started'})
                 
             except Exception as e:
-                return jsonify({'success': False, 'error': str(e)})
+                return self._json_response({'success': False, 'error': str(e)})
     
     def start_web_interface(self, host='127.0.0.1', port=5000, debug=False):
         """Start the web interface."""
         print(f"🌐 Starting web interface at http://{host}:{port}")
-        self.flask_app.run(host=host, port=port, debug=debug)
+        
+        if self._stats_thread is None:
+            self._stats_thread = threading.Thread(target=self._stats_refresher, daemon=True)
+            self._stats_thread.start()
+        
+        if debug:
+            self.flask_app.run(host=host, port=port, debug=debug)
+            return
+        
+        # Serve with a threaded WSGI server so slow requests don't block polling
+        try:
+            from waitress import serve
+        except ImportError:
+            print("⚠️ waitress not installed, using the Flask development server")
+            self.flask_app.run(host=host, port=port, debug=debug)
+            return
+        
+        serve(self.flask_app, host=host, port=port, threads=8, connection_limit=200)
     
     def start_file_watching(self):
         """Start file watching in background."""
@@ -405,7 +1009,7 @@ class FileNinjaApp:
         print("🚀 Starting complete FileNinja system...")
         
         # Initialize database
-        if self.db.connect():
+        if self._ensure_db():
             self.db.initialize_tables()
             print("✅ Database initialized")
         
@@ -430,7 +1034,7 @@ class FileNinjaApp:
         """Get application status."""
         return {
             'core': self.core.get_status(),
-            'database': self.db.connect() if hasattr(self.db, 'connect') else True
+            'database': self._ensure_db()
         }
 
 
@@ -6,30 +6,81 @@ into a single, streamlined module for easier maintenance and deployment.
 """
 
 import os
+import errno
 import shutil
+import stat
 import time
 import platform
 import re
-import hashlib
+import fnmatch
 import threading
 import json
+import sqlite3
+import sys
+import atexit
+import logging
+import logging.handlers
+import queue
+import itertools
+import contextlib
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Set, Dict, Callable, Optional, Tuple
 from datetime import datetime
 
+# Log records are queued and written by a listener thread, so the threads
+# moving files never block on console output
+logger = logging.getLogger('fileninja')
+
+
+def _setup_logging():
+    """Route 'fileninja' log records through a queue to stdout, once per process."""
+    if logger.handlers:
+        return
+    
+    log_queue = queue.Queue()
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter('%(message)s'))
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    listener.start()
+    atexit.register(listener.stop)
+    
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+
 # Import watchdog components with Windows compatibility
 from watchdog.events import FileSystemEventHandler, FileSystemEvent
 
 # Windows compatibility - use polling observer
+USING_POLLING_OBSERVER = False
 if platform.system() == "Windows":
     try:
         from watchdog.observers.polling import PollingObserver as Observer
-        print("🔧 Using PollingObserver for Windows compatibility")
+        USING_POLLING_OBSERVER = True
     except ImportError:
         from watchdog.observers import Observer
 else:
     from watchdog.observers import Observer
 
+# Optional Aho-Corasick automaton for keyword tagging
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Existing files are moved on a thread pool with at most this many queued
+EXISTING_MAX_PENDING = 256
+EXISTING_WORKERS = min(16, (os.cpu_count() or 4) * 2)
+
+# Seconds a walked get_organization_stats result is reused when nothing moves
+STATS_WALK_TTL = 60
+
+# Threads processing debounced watcher events
+EVENT_WORKERS = 4
+
 
 class FileNinjaCore:
     """
@@ -39,29 +90,81 @@ class FileNinjaCore:
     
     def __init__(self, config_path: str = "config.json"):
         """Initialize FileNinja Core with configuration."""
-        self.config = self._load_config(config_path)
-        self.base_folder = Path(self.config.get("organized_folder", "./Organized_Files"))
-        self.watched_folders = self.config.get("watched_folders", [])
+        _setup_logging()
+        self.config_path = config_path
+        self._apply_config(self._load_config(config_path))
         
         # File organization mappings
-        self.file_type_mapping = self._get_file_type_mapping()
+        self.file_type_mapping = {
+            sys.intern(extension): file_type
+            for extension, file_type in self._get_file_type_mapping().items()
+        }
         self.organization_structure = self._get_organization_structure()
         self.tag_rules = self._get_tag_rules()
+        self._kw_ac = self._build_keyword_automaton()
+        
+        # Tags that route a file to its own folder, highest priority first
+        self._priority_tags = ('finance', 'work', 'personal', 'education')
+        self._priority_set = frozenset(self._priority_tags)
+        self._tag_folders = self._build_tag_folders()
+        self._date_re = re.compile(r"(19|20)\d{2}|jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec")
+        
+        # Tags, types and destinations depend only on the file name, so cache
+        # them per instance (bounded, the watcher can run indefinitely)
+        self._compute_tags = lru_cache(maxsize=4096)(self._compute_tags)
+        self._type_for_suffix = lru_cache(maxsize=4096)(self._type_for_suffix)
+        self._destination_for = lru_cache(maxsize=4096)(self._destination_for)
         
-        # File watcher components
-        self.observer = Observer()
+        # File watcher components. The polling observer re-scans every watched
+        # tree each interval, so it gets a longer one than watchdog's 1 second;
+        # native observers (inotify, FSEvents) are event driven and idle for free
+        if USING_POLLING_OBSERVER:
+            self.observer = Observer(timeout=self.config.get("poll_interval", 10))
+        else:
+            self.observer = Observer()
         self.watched_paths = {}
         self.is_running = False
-        self.pending_files = {}
+        # (path, mtime_ns, size) keys of files being moved right now, so a
+        # duplicate event for the same file is skipped while its move runs
         self.processed_files = set()
         self.lock = threading.Lock()
         
+        # Debounced watcher events: (deadline, seq, path, event_type) entries in
+        # a priority queue drained by EVENT_WORKERS threads, plus the latest
+        # deadline per path; entries whose deadline no longer matches are stale
+        self._events_q = queue.PriorityQueue()
+        self._event_seq = itertools.count()
+        self._pending_deadlines = {}
+        self._event_workers = []
+        
+        # Destinations picked but not yet moved to, so concurrent moves of
+        # same-named files don't choose the same path
+        self._reserved_dests = set()
+        self._dest_lock = threading.Lock()
+        
+        # Cross-device copies run one at a time on a dedicated thread
+        self._copy_pool = None
+        
+        # Database used to log moves, connected on first use
+        self._db = None
+        self._db_lock = threading.Lock()
+        # Sweeps currently using self._db; it is not closed under them
+        self._db_holders = 0
+        
+        # (timestamp, stats) from the last organized folder walk
+        self._stats_walk_cache = None
+        
+        # Callbacks notified about core events, called as callback(event, details)
+        self.listeners: List[Callable[[str, Dict], None]] = []
+        
         # Ensure base folder exists
         self.base_folder.mkdir(parents=True, exist_ok=True)
         
-        print(f"🥷 FileNinja Core initialized")
-        print(f"📁 Organized folder: {self.base_folder}")
-        print(f"👀 Watched folders: {len(self.watched_folders)}")
+        if USING_POLLING_OBSERVER:
+            logger.info("🔧 Using PollingObserver for Windows compatibility")
+        logger.info(f"🥷 FileNinja Core initialized")
+        logger.info(f"📁 Organized folder: {self.base_folder}")
+        logger.info(f"👀 Watched folders: {len(self.watched_folders)}")
     
     def _load_config(self, config_path: str) -> Dict:
         """Load configuration from file."""
@@ -70,6 +173,7 @@ class FileNinjaCore:
             "organized_folder": "./Organized_Files",
             "auto_organize": True,
             "delay_seconds": 2,
+            "poll_interval": 10,
             "max_file_size_mb": 1000,
             "ignore_patterns": [
                 "*.tmp", "*.temp", "*.part", "*.crdownload",
@@ -83,37 +187,69 @@ class FileNinjaCore:
                     loaded_config = json.load(f)
                     default_config.update(loaded_config)
         except Exception as e:
-            print(f"⚠️ Error loading config: {e}")
+            logger.warning(f"⚠️ Error loading config: {e}")
         
         return default_config
     
+    def reload_config(self):
+        """
+        Reload configuration from disk and notify listeners.
+        
+        Changes to watched folders take effect the next time watching starts.
+        """
+        self._apply_config(self._load_config(self.config_path))
+        self._tag_folders = self._build_tag_folders()
+        self._destination_for.cache_clear()
+        self._stats_walk_cache = None
+        self.base_folder.mkdir(parents=True, exist_ok=True)
+        self._notify('config')
+    
+    def _apply_config(self, config: Dict):
+        """Set the config and the settings derived from it, compiling ignore patterns once."""
+        self.config = config
+        self.base_folder = Path(config.get("organized_folder", "./Organized_Files"))
+        self.watched_folders = config.get("watched_folders", [])
+        self._ignore_patterns = tuple(config.get("ignore_patterns", []))
+        self._ignore_re = self._compile_ignore_patterns(self._ignore_patterns)
+        self._max_size_bytes = config.get("max_file_size_mb", 1000) * 1024 * 1024
+    
+    @staticmethod
+    def _compile_ignore_patterns(patterns: Tuple[str, ...]) -> Optional[re.Pattern]:
+        """Combine glob ignore patterns into one case-insensitive regex, or None if empty."""
+        if not patterns:
+            return None
+        return re.compile(
+            '|'.join(f'(?:{fnmatch.translate(pattern)})' for pattern in patterns),
+            re.IGNORECASE
+        )
+    
     def _get_file_type_mapping(self) -> Dict[str, str]:
-        """Get mapping of file extensions to file types."""
+        """Get mapping of file extensions (lowercase, without the dot) to file types."""
         return {
             # PDFs
-            '.pdf': 'PDFs',
+            'pdf': 'PDFs',
             
             # Documents (Word, text, presentations, spreadsheets)
-            '.doc': 'Documents', '.docx': 'Documents', '.txt': 'Documents', 
-            '.rtf': 'Documents', '.odt': 'Documents', '.xls': 'Documents', 
-            '.xlsx': 'Documents', '.csv': 'Documents', '.ppt': 'Documents', 
-            '.pptx': 'Documents',
+            'doc': 'Documents', 'docx': 'Documents', 'txt': 'Documents', 
+            'rtf': 'Documents', 'odt': 'Documents', 'xls': 'Documents', 
+            'xlsx': 'Documents', 'csv': 'Documents', 'ppt': 'Documents', 
+            'pptx': 'Documents',
             
             # Images
-            '.jpg': 'Images', '.jpeg': 'Images', '.png': 'Images',
-            '.gif': 'Images', '.bmp': 'Images', '.svg': 'Images',
-            '.webp': 'Images', '.tiff': 'Images',
+            'jpg': 'Images', 'jpeg': 'Images', 'png': 'Images',
+            'gif': 'Images', 'bmp': 'Images', 'svg': 'Images',
+            'webp': 'Images', 'tiff': 'Images',
             
             # Everything else goes to Other
-            '.mp4': 'Other', '.avi': 'Other', '.mkv': 'Other',
-            '.mov': 'Other', '.wmv': 'Other', '.webm': 'Other',
-            '.mp3': 'Other', '.wav': 'Other', '.flac': 'Other',
-            '.aac': 'Other', '.ogg': 'Other', '.m4a': 'Other',
-            '.zip': 'Other', '.rar': 'Other', '.7z': 'Other',
-            '.tar': 'Other', '.gz': 'Other',
-            '.py': 'Other', '.js': 'Other', '.html': 'Other',
-            '.css': 'Other', '.json': 'Other', '.xml': 'Other',
-            '.exe': 'Other', '.msi': 'Other'
+            'mp4': 'Other', 'avi': 'Other', 'mkv': 'Other',
+            'mov': 'Other', 'wmv': 'Other', 'webm': 'Other',
+            'mp3': 'Other', 'wav': 'Other', 'flac': 'Other',
+            'aac': 'Other', 'ogg': 'Other', 'm4a': 'Other',
+            'zip': 'Other', 'rar': 'Other', '7z': 'Other',
+            'tar': 'Other', 'gz': 'Other',
+            'py': 'Other', 'js': 'Other', 'html': 'Other',
+            'css': 'Other', 'json': 'Other', 'xml': 'Other',
+            'exe': 'Other', 'msi': 'Other'
         }
     
     def _get_organization_structure(self) -> Dict[str, List[str]]:
@@ -142,122 +278,209 @@ class FileNinjaCore:
             }
         }
     
+    def _build_keyword_automaton(self):
+        """
+        Build an Aho-Corasick automaton over all tag keywords.
+        
+        Returns None when pyahocorasick is not installed, in which case
+        keywords are matched one by one.
+        """
+        if ahocorasick is None:
+            return None
+        
+        categories_by_keyword = {}
+        for category, rules in self.tag_rules.items():
+            for keyword in rules.get("keywords", []):
+                categories_by_keyword.setdefault(keyword, []).append(category)
+        if not categories_by_keyword:
+            return None
+        
+        automaton = ahocorasick.Automaton()
+        for keyword, categories in categories_by_keyword.items():
+            automaton.add_word(keyword, tuple(categories))
+        automaton.make_automaton()
+        return automaton
+    
     # FILE TAGGING METHODS
     def get_file_tags(self, file_path: str) -> List[str]:
         """Get tags for a file based on filename analysis."""
         filename = os.path.basename(file_path).lower()
-        name_without_ext = os.path.splitext(filename)[0]
+        name_without_ext, file_extension = os.path.splitext(filename)
+        return list(self._compute_tags(name_without_ext, file_extension))
+    
+    def _compute_tags(self, name_without_ext: str, file_extension: str) -> Tuple[str, ...]:
+        """Compute the sorted tags for a lowercased file name and extension."""
         tags = set()
         
-        # Check tag rules
-        for category, rules in self.tag_rules.items():
-            for keyword in rules.get("keywords", []):
-                if keyword in name_without_ext:
-                    tags.add(category)
-                    break
+        # Check tag rules, in one pass over the name when the automaton is available
+        if self._kw_ac is not None:
+            for _, categories in self._kw_ac.iter(name_without_ext):
+                tags.update(categories)
+        else:
+            for category, rules in self.tag_rules.items():
+                for keyword in rules.get("keywords", []):
+                    if keyword in name_without_ext:
+                        tags.add(category)
+                        break
         
         # Add file type tag
-        file_extension = Path(file_path).suffix.lower()
         if file_extension:
             tags.add(f"type_{file_extension[1:]}")
         
         # Add date tags
-        date_patterns = [r"(19|20)\d{2}", r"jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec"]
-        for pattern in date_patterns:
-            if re.search(pattern, name_without_ext):
-                tags.add("dated")
-                break
+        if self._date_re.search(name_without_ext):
+            tags.add("dated")
         
-        return sorted(list(tags))
+        return tuple(sorted(tags))
     
     # FILE ORGANIZATION METHODS
     def get_file_type(self, file_path: str) -> str:
         """Determine file type based on extension."""
-        extension = Path(file_path).suffix.lower()
+        name = os.path.basename(file_path)
+        dot = name.rfind('.')
+        return self._type_for_suffix(name[dot + 1:].lower() if dot > 0 else '')
+    
+    def _type_for_suffix(self, extension: str) -> str:
+        """Map a lowercased extension (without the dot) to its file type."""
         return self.file_type_mapping.get(extension, 'Other')
     
     def get_destination_folder(self, file_path: str, tags: List[str] = None) -> Path:
         """Get destination folder for a file."""
-        file_type = self.get_file_type(file_path)
-        
+        return Path(self._destination_dir(file_path, tags))
+    
+    def _destination_dir(self, file_path: str, tags: List[str] = None) -> str:
+        """Destination folder for a file as a plain path string."""
+        return self._destination_for(self.get_file_type(file_path), tuple(tags) if tags else ())
+    
+    def _destination_for(self, file_type: str, tags: Tuple[str, ...]) -> str:
+        """Pick the destination folder for a file type and its tags."""
         # Check for priority tags
-        if tags:
-            priority_tags = ['finance', 'work', 'personal', 'education']
-            for priority_tag in priority_tags:
-                if priority_tag in tags:
-                    return self.base_folder / f"{priority_tag.title()}_Files"
+        hit = self._priority_set.intersection(tags)
+        if hit:
+            return self._tag_folders[next(tag for tag in self._priority_tags if tag in hit)]
         
         # Use file type folder
-        return self.base_folder / file_type
+        return os.path.join(str(self.base_folder), file_type)
+    
+    def _build_tag_folders(self) -> Dict[str, str]:
+        """Map each priority tag to its folder under the organized folder."""
+        base_folder = str(self.base_folder)
+        return {tag: os.path.join(base_folder, f"{tag.title()}_Files") for tag in self._priority_tags}
     
     def handle_filename_conflict(self, dest_path: Path) -> Path:
         """Handle filename conflicts by appending numbers."""
-        if not dest_path.exists():
+        return Path(self._free_dest(str(dest_path)))
+    
+    def _free_dest(self, dest_path: str) -> str:
+        """Return dest_path, or a numbered variant of it if that is taken."""
+        if not self._dest_taken(dest_path):
             return dest_path
         
-        base = dest_path.stem
-        suffix = dest_path.suffix
-        parent = dest_path.parent
-        counter = 1
+        parent, name = os.path.split(dest_path)
+        base, suffix = os.path.splitext(name)
+        
+        # List the folder once and probe numbered names in memory. Names are
+        # casefolded so case-insensitive file systems never get an overwrite.
+        taken = {
+            os.path.basename(path).casefold()
+            for path in self._reserved_dests
+            if os.path.dirname(path) == parent
+        }
+        try:
+            with os.scandir(parent) as it:
+                taken.update(entry.name.casefold() for entry in it)
+        except OSError:
+            pass
         
-        while counter <= 1000:
+        for counter in range(1, 1001):
             new_name = f"{base}_{counter}{suffix}"
-            new_path = parent / new_name
-            if not new_path.exists():
-                return new_path
-            counter += 1
+            if new_name.casefold() not in taken:
+                return os.path.join(parent, new_name)
         
         # Fallback with timestamp
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        return parent / f"{base}_{timestamp}{suffix}"
+        return os.path.join(parent, f"{base}_{timestamp}{suffix}")
+    
+    def _dest_taken(self, dest_path: str) -> bool:
+        """Check if a destination exists or is reserved by an in-flight move."""
+        return dest_path in self._reserved_dests or os.path.exists(dest_path)
     
-    def move_file(self, source_path: str, tags: List[str] = None) -> Tuple[bool, str, str]:
-        """Move a file to its organized location."""
+    def move_file(self, source_path: str, tags: List[str] = None,
+                  st: Optional[os.stat_result] = None) -> Tuple[bool, str, str]:
+        """
+        Move a file to its organized location.
+        
+        st is the source's os.stat() result if the caller already has it.
+        """
         try:
-            source = Path(source_path)
-            if not source.exists() or not source.is_file():
+            if st is None:
+                try:
+                    st = os.stat(source_path)
+                except OSError:
+                    st = None
+            if st is None or not stat.S_ISREG(st.st_mode):
                 return False, "", f"Invalid source file: {source_path}"
             
             # Get destination
-            dest_folder = self.get_destination_folder(source_path, tags)
-            dest_path = dest_folder / source.name
-            dest_path = self.handle_filename_conflict(dest_path)
-            
-            # Create destination folder
-            dest_path.parent.mkdir(parents=True, exist_ok=True)
+            dest_folder = self._destination_dir(source_path, tags)
+            dest_name = os.path.basename(source_path)
+            with self._dest_lock:
+                dest_path = self._free_dest(os.path.join(dest_folder, dest_name))
+                self._reserved_dests.add(dest_path)
             
-            # Move file
-            shutil.move(str(source), str(dest_path))
-            return True, str(dest_path), f"Moved to: {dest_path.name}"
+            try:
+                # Create destination folder
+                os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+                
+                # Move file
+                self._move(source_path, dest_path)
+            finally:
+                with self._dest_lock:
+                    self._reserved_dests.discard(dest_path)
+            return True, dest_path, f"Moved to: {os.path.basename(dest_path)}"
             
         except Exception as e:
             return False, "", f"Error moving file: {str(e)}"
     
+    def _move(self, source: str, dest: str):
+        """
+        Move source to dest with a single rename when both are on one file system.
+        
+        Falls back to shutil.move (copy then delete) across devices; on Linux its
+        copy already uses os.sendfile. Those copies are handed to a single copy
+        worker so parallel moves stream one file at a time instead of
+        competing for the same disk.
+        """
+        try:
+            os.replace(source, dest)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            with self._dest_lock:
+                if self._copy_pool is None:
+                    self._copy_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='fileninja-copy')
+            self._copy_pool.submit(shutil.move, source, dest).result()
+    
     # FILE WATCHING METHODS
     def should_ignore_file(self, file_path: str) -> bool:
         """Check if file should be ignored based on patterns."""
-        filename = os.path.basename(file_path).lower()
-        ignore_patterns = self.config.get("ignore_patterns", [])
-        
-        for pattern in ignore_patterns:
-            if pattern.startswith('*') and filename.endswith(pattern[1:]):
-                return True
-            elif pattern.endswith('*') and filename.startswith(pattern[:-1]):
-                return True
-            elif pattern in filename:
-                return True
-        
-        return False
+        if self._ignore_re is None:
+            return False
+        return self._ignore_re.match(os.path.basename(file_path)) is not None
     
-    def should_process_file(self, file_path: str) -> bool:
-        """Check if file should be processed."""
+    def should_process_file(self, file_path: str, st: Optional[os.stat_result] = None) -> bool:
+        """
+        Check if file should be processed.
+        
+        st is the file's os.stat() result if the caller already has it.
+        """
         try:
             if self.should_ignore_file(file_path):
                 return False
             
             # Check file size
-            max_size = self.config.get("max_file_size_mb", 1000) * 1024 * 1024
-            if os.path.getsize(file_path) > max_size:
+            size = st.st_size if st is not None else os.path.getsize(file_path)
+            if size > self._max_size_bytes:
                 return False
             
             return True
@@ -267,43 +490,104 @@ class FileNinjaCore:
     def process_file(self, file_path: str, event_type: str = "created"):
         """Process a detected file."""
         try:
-            if not self.should_process_file(file_path):
+            if self.should_ignore_file(file_path):
                 return
             
-            print(f"📂 Processing {event_type} file: {os.path.basename(file_path)}")
+            # One stat serves the size check, the move and the database log.
+            # The size check is inlined because should_process_file() would
+            # run the ignore pattern a second time
+            try:
+                st = os.stat(file_path)
+            except OSError:
+                return
+            if st.st_size > self._max_size_bytes:
+                return
             
-            # Get tags
-            tags = self.get_file_tags(file_path)
+            # Claim the file for the length of its move so a duplicate event is
+            # skipped; once moved it is gone, and a new file saved at the same
+            # path later is a new file to organize
+            key = (file_path, st.st_mtime_ns, st.st_size)
+            with self.lock:
+                if key in self.processed_files:
+                    return
+                self.processed_files.add(key)
             
-            # Move file
-            success, dest_path, message = self.move_file(file_path, tags)
+            try:
+                logger.info(f"📂 Processing {event_type} file: {os.path.basename(file_path)}")
+                
+                # Get tags
+                tags = self.get_file_tags(file_path)
+                
+                # Move file
+                success, dest_path, message = self.move_file(file_path, tags, st=st)
+            finally:
+                with self.lock:
+                    self.processed_files.discard(key)
             
             if success:
-                print(f"✅ {message}")
+                self._stats_walk_cache = None
+                logger.info(f"✅ {message}")
                 # Log to database if available
-                self.log_file_movement(file_path, dest_path, tags)
+                self.log_file_movement(file_path, dest_path, tags, st.st_size)
+                self._notify('moved', source=file_path, dest=dest_path)
             else:
-                print(f"❌ {message}")
+                logger.error(f"❌ {message}")
                 
         except Exception as e:
-            print(f"❌ Error processing file {file_path}: {e}")
+            logger.error(f"❌ Error processing file {file_path}: {e}")
     
-    def log_file_movement(self, source_path: str, dest_path: str, tags: List[str]):
-        """Log file movement to database."""
-        try:
+    def _get_db(self):
+        """Return the shared database manager, connecting on first use."""
+        if self._db is None:
             from db_manager import DatabaseManager
-            import os
             
-            db = DatabaseManager()
-            if db.connect():
+            try:
+                self._db = DatabaseManager()
+            except sqlite3.Error:
+                return None
+        return self._db
+    
+    def log_file_movement(self, source_path: str, dest_path: str, tags: List[str],
+                          file_size: Optional[int] = None):
+        """Log file movement to database."""
+        try:
+            with self._db_lock:
+                db = self._get_db()
+                if db is None:
+                    return
+                
                 # Get file information
                 original_name = os.path.basename(source_path)
-                file_size = os.path.getsize(source_path) if os.path.exists(source_path) else 0
+                if file_size is None:
+                    file_size = os.path.getsize(dest_path) if os.path.exists(dest_path) else 0
                 file_type = self.get_file_type(source_path)
                 
-                db.log_file_movement(original_name, dest_path, file_type, file_size, tags)
+                if not db.log_file_movement(original_name, dest_path, file_type, file_size, tags):
+                    # Reconnect on the next move in case the connection went bad,
+                    # unless a sweep still has batches open on this manager
+                    if not self._db_holders:
+                        db.close_connection()
+                        self._db = None
         except Exception as e:
-            print(f"⚠️ Could not log to database: {e}")
+            logger.warning(f"⚠️ Could not log to database: {e}")
+    
+    # EVENT NOTIFICATION METHODS
+    def add_listener(self, callback: Callable[[str, Dict], None]):
+        """
+        Register a callback to be notified about core events.
+        
+        Events: 'moved' (source, dest), 'logged' (batched movements written
+        to the database), 'config', 'started' and 'stopped'.
+        """
+        self.listeners.append(callback)
+    
+    def _notify(self, event: str, **details):
+        """Notify registered listeners about an event."""
+        for callback in list(self.listeners):
+            try:
+                callback(event, details)
+            except Exception as e:
+                logger.warning(f"⚠️ Listener error on {event}: {e}")
     
     # FILE WATCHER EVENT HANDLER
     def create_event_handler(self):
@@ -325,24 +609,38 @@ class FileNinjaCore:
     
     def schedule_file_processing(self, file_path: str, event_type: str):
         """Schedule file processing with delay."""
-        delay = self.config.get("delay_seconds", 2)
+        deadline = time.monotonic() + self.config.get("delay_seconds", 2)
         
         with self.lock:
-            # Cancel previous timer if exists
-            if file_path in self.pending_files:
-                self.pending_files[file_path].cancel()
+            # A newer event for the same path replaces the pending one
+            self._pending_deadlines[file_path] = deadline
+        self._events_q.put((deadline, next(self._event_seq), file_path, event_type))
+    
+    def _event_worker(self):
+        """Process queued files once their debounce deadline has passed."""
+        while True:
+            deadline, _, file_path, event_type = self._events_q.get()
+            if file_path is None:
+                return
             
-            # Schedule new processing
-            timer = threading.Timer(delay, self.process_file, args=[file_path, event_type])
-            self.pending_files[file_path] = timer
-            timer.start()
+            if self._pending_deadlines.get(file_path) != deadline:
+                continue
+            delay = deadline - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            
+            with self.lock:
+                if self._pending_deadlines.get(file_path) != deadline:
+                    continue
+                del self._pending_deadlines[file_path]
+            self.process_file(file_path, event_type)
     
     # MAIN CONTROL METHODS
     def start_watching(self) -> bool:
         """Start file watching."""
         try:
             if self.is_running:
-                print("⚠️ Already running")
+                logger.warning("⚠️ Already running")
                 return False
             
             # Add watched folders
@@ -351,21 +649,28 @@ class FileNinjaCore:
                 if os.path.exists(folder):
                     watch = self.observer.schedule(handler, folder, recursive=True)
                     self.watched_paths[folder] = watch
-                    print(f"👀 Watching: {folder}")
+                    logger.info(f"👀 Watching: {folder}")
                 else:
-                    print(f"⚠️ Folder not found: {folder}")
+                    logger.warning(f"⚠️ Folder not found: {folder}")
             
             if not self.watched_paths:
-                print("❌ No valid folders to watch")
+                logger.error("❌ No valid folders to watch")
                 return False
             
             self.observer.start()
+            self._event_workers = [
+                threading.Thread(target=self._event_worker, name=f'fileninja-events-{i}', daemon=True)
+                for i in range(EVENT_WORKERS)
+            ]
+            for worker in self._event_workers:
+                worker.start()
             self.is_running = True
-            print(f"🎯 FileNinja started - monitoring {len(self.watched_paths)} folder(s)")
+            self._notify('started')
+            logger.info(f"🎯 FileNinja started - monitoring {len(self.watched_paths)} folder(s)")
             return True
             
         except Exception as e:
-            print(f"❌ Error starting: {e}")
+            logger.error(f"❌ Error starting: {e}")
             return False
     
     def stop_watching(self):
@@ -377,17 +682,19 @@ class FileNinjaCore:
             self.observer.stop()
             self.observer.join(timeout=5)
             self.is_running = False
+            self._notify('stopped')
             
-            # Cancel pending timers
+            # Drop pending events and stop the workers; sentinels sort first
             with self.lock:
-                for timer in self.pending_files.values():
-                    timer.cancel()
-                self.pending_files.clear()
+                self._pending_deadlines.clear()
+            for _ in self._event_workers:
+                self._events_q.put((float('-inf'), next(self._event_seq), None, None))
+            self._event_workers = []
             
-            print("🛑 FileNinja stopped")
+            logger.info("🛑 FileNinja stopped")
             
         except Exception as e:
-            print(f"❌ Error stopping: {e}")
+            logger.error(f"❌ Error stopping: {e}")
     
     def get_status(self) -> Dict:
         """Get current status."""
@@ -396,32 +703,106 @@ class FileNinjaCore:
             'watched_folders': list(self.watched_paths.keys()),
             'watched_count': len(self.watched_paths),
             'base_folder': str(self.base_folder),
-            'pending_files': len(self.pending_files)
+            'pending_files': len(self._pending_deadlines)
         }
     
+    def _iter_candidates(self, folder: str):
+        """
+        Yield paths of files under folder that pass the ignore and size checks.
+        
+        Walks with os.scandir so the listing is produced incrementally and
+        each entry's type and size come from the cached DirEntry data.
+        """
+        max_size = self._max_size_bytes
+        stack = [folder]
+        while stack:
+            try:
+                it = os.scandir(stack.pop())
+            except OSError:
+                continue
+            with it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file():
+                            if self.should_ignore_file(entry.name):
+                                continue
+                            if entry.stat().st_size > max_size:
+                                continue
+                            yield entry.path
+                    except OSError:
+                        continue
+    
     def organize_existing_files(self, folder_path: str = None):
         """Organize existing files in watched folders."""
         folders_to_scan = [folder_path] if folder_path else self.watched_folders
         
-        for folder in folders_to_scan:
-            if not os.path.exists(folder):
-                continue
-            
-            print(f"🔍 Scanning existing files in: {folder}")
-            processed_count = 0
-            
-            for root, dirs, files in os.walk(folder):
-                for filename in files:
-                    file_path = os.path.join(root, filename)
+        # Log the sweep's moves in batches, one commit per batch rather than
+        # one per file, and rebuild indexes once at the end of a large sweep.
+        # Not a db.transaction(): the pool threads write the batches, and they
+        # would wait on the transaction's write lock while it waits on them
+        with self._db_lock:
+            db = self._get_db()
+            if db is not None:
+                self._db_holders += 1
+        
+        try:
+            with contextlib.ExitStack() as stack:
+                if db is not None:
+                    stack.enter_context(db.bulk_load())
+                    stack.enter_context(db.batched())
+                pool = stack.enter_context(ThreadPoolExecutor(max_workers=EXISTING_WORKERS,
+                                                              thread_name_prefix='fileninja-organize'))
+                for folder in folders_to_scan:
+                    if not os.path.exists(folder):
+                        continue
                     
-                    if self.should_process_file(file_path):
-                        self.process_file(file_path, 'existing')
+                    logger.info(f"🔍 Scanning existing files in: {folder}")
+                    processed_count = 0
+                    
+                    # Keep a rolling window of moves in flight: when it is full,
+                    # wait for any one to finish before reading the next file
+                    pending = set()
+                    for file_path in self._iter_candidates(folder):
+                        if len(pending) >= EXISTING_MAX_PENDING:
+                            _, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        pending.add(pool.submit(self.process_file, file_path, 'existing'))
                         processed_count += 1
-            
-            print(f"✅ Processed {processed_count} existing files from {folder}")
+                    wait(pending)
+                    
+                    logger.info(f"✅ Processed {processed_count} existing files from {folder}")
+        finally:
+            if db is not None:
+                with self._db_lock:
+                    self._db_holders -= 1
+                # 'moved' fired as each file moved, but the batched rows are
+                # only in the log now that the last batch has been written
+                self._notify('logged')
+    
+    def _scan(self, folder: str):
+        """Yield a DirEntry for every file under folder, without following symlinked folders."""
+        try:
+            it = os.scandir(folder)
+        except OSError:
+            return
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        yield from self._scan(entry.path)
+                    elif entry.is_file():
+                        yield entry
+                except OSError:
+                    continue
     
     def get_organization_stats(self) -> Dict:
-        """Get statistics about organized files."""
+        """
+        Get statistics about organized files.
+        
+        Counts the files on disk in the organized folder. The walk is reused
+        for STATS_WALK_TTL seconds, or until the next file is moved.
+        """
         stats = {
             'total_files': 0,
             'total_size': 0,
@@ -429,26 +810,30 @@ class FileNinjaCore:
             'recent_activity': []
         }
         
+        cached = self._stats_walk_cache
+        if cached is not None and time.monotonic() - cached[0] < STATS_WALK_TTL:
+            return cached[1]
+        
         if not self.base_folder.exists():
             return stats
         
-        for file_path in self.base_folder.rglob('*'):
-            if file_path.is_file():
-                stats['total_files'] += 1
-                try:
-                    file_size = file_path.stat().st_size
-                    stats['total_size'] += file_size
-                    
-                    file_type = self.get_file_type(str(file_path))
-                    if file_type not in stats['by_type']:
-                        stats['by_type'][file_type] = {'count': 0, 'size': 0}
-                    
-                    stats['by_type'][file_type]['count'] += 1
-                    stats['by_type'][file_type]['size'] += file_size
-                    
-                except Exception:
-                    pass
+        for entry in self._scan(str(self.base_folder)):
+            stats['total_files'] += 1
+            try:
+                file_size = entry.stat().st_size
+                stats['total_size'] += file_size
+                
+                file_type = self.get_file_type(entry.name)
+                if file_type not in stats['by_type']:
+                    stats['by_type'][file_type] = {'count': 0, 'size': 0}
+                
+                stats['by_type'][file_type]['count'] += 1
+                stats['by_type'][file_type]['size'] += file_size
+                
+            except Exception:
+                pass
         
+        self._stats_walk_cache = (time.monotonic(), stats)
         return stats
 
 
@@ -10,10 +10,81 @@ This module handles all database operations including:
 
 import sqlite3
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 import json
+import logging
 import os
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
+import weakref
+
+# Child of the core's 'fileninja' logger, so records share its handler;
+# successes are logged at DEBUG and stay off the write path
+logger = logging.getLogger('fileninja.db')
+
+try:
+    import orjson
+    
+    def _json_dumps(obj) -> str:
+        """Serialize obj to a JSON string with orjson."""
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    
+    _json_loads = orjson.loads
+except ImportError:  # stdlib fallback
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
+
+@lru_cache(maxsize=1024)
+def _encode_tags(tags: Tuple[str, ...]) -> str:
+    """JSON-encode a tag list; memoized since many files share the same tags."""
+    return _json_dumps(list(tags))
+
+# file_logs columns in the order every log query selects them
+LOG_COLUMNS = ('id', 'original_name', 'new_path', 'file_type',
+               'file_size', 'tags', 'moved_at', 'created_at')
+_SELECT_LOGS = "SELECT " + ", ".join(LOG_COLUMNS) + " FROM file_logs"
+
+
+def _build_row_converter(columns: Tuple[str, ...]):
+    """
+    Generate a function converting a row with these columns into a dict.
+    
+    The keys and positions are written into the function's source, so each
+    row costs one dict display rather than a zip over the column names.
+    The tags column is decoded from JSON.
+    """
+    items = []
+    for index, column in enumerate(columns):
+        if column == 'tags':
+            items.append(f"{column!r}: _json_loads(row[{index}]) if row[{index}] else []")
+        else:
+            items.append(f"{column!r}: row[{index}]")
+    source = "def _row_to_dict(row):\n    return {" + ", ".join(items) + "}\n"
+    namespace = {'_json_loads': _json_loads}
+    exec(source, namespace)
+    return namespace['_row_to_dict']
+
+
+_row_to_dict = _build_row_converter(LOG_COLUMNS)
+
+
+class _ReadConnection:
+    """Holds one thread's read connection and closes it when discarded."""
+    
+    def __init__(self, connection: sqlite3.Connection):
+        self.connection = connection
+    
+    def close(self):
+        """Close the connection; later _get_conn() calls open a new one."""
+        connection, self.connection = self.connection, None
+        if connection is not None:
+            connection.close()
+    
+    def __del__(self):
+        self.close()
 
 
 class DatabaseManager:
@@ -24,44 +95,183 @@ class DatabaseManager:
     for tracking file movements and maintaining application logs.
     """
     
-    def __init__(self, database_path: str = "fileninja.db"):
-        """Initialize database connection parameters."""
+    _INSERT_SQL = (
+        "INSERT INTO file_logs (original_name, new_path, file_type, file_size, tags, moved_at) "
+        "VALUES (?, ?, ?, ?, ?, ?)"
+    )
+    
+    # Batches up to this size are inserted with one multi-row VALUES statement;
+    # larger ones use executemany
+    MULTI_ROW_LIMIT = 50
+    
+    # INSERT ... RETURNING needs SQLite 3.35+
+    HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+    
+    # Secondary indexes on logged rows; bulk_load() drops and rebuilds these
+    BULK_LOAD_INDEXES = {
+        'idx_moved_id': "CREATE INDEX IF NOT EXISTS idx_moved_id ON file_logs(moved_at DESC, id DESC)",
+        'idx_type_moved': "CREATE INDEX IF NOT EXISTS idx_type_moved ON file_logs(file_type, moved_at DESC, id DESC)",
+        'idx_original_name': "CREATE INDEX IF NOT EXISTS idx_original_name ON file_logs(original_name)",
+        'idx_tag': "CREATE INDEX IF NOT EXISTS idx_tag ON file_tags(tag)",
+    }
+    
+    # get_file_logs filter clauses, in the order of its filter arguments
+    _LOG_FILTER_SQL = (
+        " AND file_type = ?",
+        " AND id IN (SELECT file_id FROM file_tags WHERE tag = ?)",
+        " AND moved_at >= ?",
+        " AND moved_at <= ?",
+        " AND (moved_at, id) < (?, ?)",
+    )
+    # get_file_logs SQL keyed by which filters (and offset) are in use, so each
+    # combination always sends the same string and hits the statement cache
+    _LOG_QUERIES: Dict[Tuple[bool, ...], str] = {}
+    
+    # Inside bulk_load() the indexes are only dropped once a batch this large
+    # is written, so small loads don't pay for a full index rebuild
+    BULK_LOAD_MIN_ROWS = 1000
+    
+    def __init__(self, database_path: str = "fileninja.db", batch_size: int = 1):
+        """
+        Initialize the manager, open the writer connection and create any
+        missing tables.
+        
+        Args:
+            database_path (str): Path to the SQLite database file
+            batch_size (int): Number of file movements buffered before they are
+                written in one transaction; 1 writes every movement immediately
+                
+        Raises:
+            sqlite3.Error: If the database cannot be opened
+        """
         self.database_path = database_path
         self.connection = None
+        self.batch_size = batch_size
+        self._pending_logs = []
+        self._buffer_lock = threading.Lock()
+        # Open batched() blocks, and the batch_size to restore after the last
+        self._batched_depth = 0
+        self._base_batch_size = batch_size
+        self._write_lock = threading.RLock()
+        self._write_cursor = None
+        # Depth of the open transaction() blocks and the thread that owns them;
+        # while non-zero, writes run as savepoints and skip their own commit
+        self._txn_depth = 0
+        self._txn_owner = None
+        # Depth of open bulk_load() blocks, and whether the indexes are dropped
+        self._bulk_depth = 0
+        self._bulk_dropped = False
+        
+        # Each thread's read connection lives in thread-local storage, so it
+        # is closed when the thread exits; close_connection() reaches the
+        # live ones through the weak registry
+        self._local = threading.local()
+        self._read_connections = weakref.WeakSet()
+        self._pool_lock = threading.Lock()
         
-    def connect(self) -> bool:
+        # Settings are cached per (key, generation); save_setting bumps the
+        # generation so earlier entries are never hit again
+        self._settings_gen = 0
+        # Set when save_setting runs inside transaction(); the generation is
+        # bumped once that transaction commits
+        self._settings_dirty = False
+        self._get_setting_cached = lru_cache(maxsize=256)(self._get_setting_cached)
+        
+        # Bring databases created by older versions up to the current schema
+        # before any query relies on file_tags or the summary tables
+        self.connect()
+        self.initialize_tables()
+        
+    def connect(self):
         """
-        Establish connection to SQLite database.
+        Establish the writer connection to the SQLite database.
         
-        Returns:
-            bool: True if connection successful, False otherwise
+        Called from __init__; only needed again to reopen the database after
+        close_connection(). Reads use per-thread connections from _get_conn();
+        all writes go through this connection under the write lock.
+        
+        Raises:
+            sqlite3.Error: If the database cannot be opened
         """
         try:
-            # Create database directory if it doesn't exist
-            db_dir = Path(self.database_path).parent
-            db_dir.mkdir(parents=True, exist_ok=True)
-            
-            self.connection = sqlite3.connect(
-                self.database_path,
-                check_same_thread=False,
-                timeout=30.0
-            )
-            
-            # Enable foreign keys and row factory for dict-like access
-            self.connection.execute("PRAGMA foreign_keys = ON")
-            self.connection.row_factory = sqlite3.Row
-            
-            print(f"✅ Connected to SQLite database: {self.database_path}")
-            return True
-            
+            self.connection = self._open_connection()
         except sqlite3.Error as e:
-            print(f"❌ Error connecting to SQLite: {e}")
-            return False
+            logger.error(f"❌ Error connecting to SQLite: {e}")
+            raise
+        logger.debug(f"✅ Connected to SQLite database: {self.database_path}")
+    
+    def _open_connection(self) -> sqlite3.Connection:
+        """Open and configure a new connection to the database."""
+        # Create database directory if it doesn't exist
+        db_dir = Path(self.database_path).parent
+        db_dir.mkdir(parents=True, exist_ok=True)
+        
+        connection = sqlite3.connect(
+            self.database_path,
+            check_same_thread=False,
+            timeout=30.0,
+            cached_statements=512
+        )
+        
+        # Enable foreign keys and row factory for dict-like access
+        connection.execute("PRAGMA foreign_keys = ON")
+        connection.row_factory = sqlite3.Row
+        self._apply_pragmas(connection)
+        return connection
+    
+    def _get_conn(self) -> Optional[sqlite3.Connection]:
+        """
+        Return the calling thread's read connection, opening it on first use.
+        
+        Returns:
+            Optional[sqlite3.Connection]: The connection, or None if it could not be opened
+        """
+        reader = getattr(self._local, 'reader', None)
+        if reader is None or reader.connection is None:
+            try:
+                reader = _ReadConnection(self._open_connection())
+            except sqlite3.Error as e:
+                logger.error(f"❌ Error connecting to SQLite: {e}")
+                return None
+            self._local.reader = reader
+            with self._pool_lock:
+                self._read_connections.add(reader)
+        return reader.connection
+    
+    def _writer(self) -> sqlite3.Connection:
+        """
+        Return the writer connection.
+        
+        Raises:
+            sqlite3.ProgrammingError: If close_connection() has closed it
+        """
+        if self.connection is None:
+            raise sqlite3.ProgrammingError("Cannot operate on a closed database.")
+        return self.connection
+    
+    def _apply_pragmas(self, connection: sqlite3.Connection):
+        """
+        Tune a new connection for write throughput.
+        
+        WAL with synchronous=NORMAL only syncs at checkpoints and lets readers
+        run alongside the writer. WAL is not available everywhere (e.g. some
+        network file systems), in which case the default journal is kept.
+        """
+        journal_mode = connection.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+        if str(journal_mode).lower() == 'wal':
+            connection.execute("PRAGMA synchronous=NORMAL")
+        else:
+            logger.warning(f"⚠️ WAL journal mode unavailable, using {journal_mode}")
+        
+        connection.execute("PRAGMA temp_store=MEMORY")
+        connection.execute("PRAGMA cache_size=-65536")      # 64 MiB
+        connection.execute("PRAGMA mmap_size=268435456")    # 256 MiB
+        connection.execute("PRAGMA busy_timeout=5000")
     
     def create_database_if_not_exists(self):
         """Create the FileNinja database if it doesn't exist."""
-        # For SQLite, this is handled automatically by connect()
-        print(f"✅ Database will be created automatically: {self.database_path}")
+        # For SQLite, this is handled automatically when the manager connects
+        logger.debug(f"✅ Database will be created automatically: {self.database_path}")
     
     def initialize_tables(self):
         """
@@ -69,14 +279,13 @@ class DatabaseManager:
         
         Tables created:
         - file_logs: Main table for tracking file movements
+        - file_tags: One row per (file, tag), for indexed tag queries
+        - file_logs_fts: Full-text index over file names (when FTS5 is available)
+        - file_type_counts, daily_activity: Running totals for get_statistics
         - app_settings: Configuration settings storage
         """
-        if not self.connection:
-            if not self.connect():
-                return False
-        
         try:
-            cursor = self.connection.cursor()
+            cursor = self._writer().cursor()
             
             # File logs table
             create_file_logs_table = """
@@ -92,6 +301,15 @@ class DatabaseManager:
             )
             """
             
+            # Tags normalized out of file_logs.tags
+            create_file_tags_table = """
+            CREATE TABLE IF NOT EXISTS file_tags (
+                file_id INTEGER NOT NULL REFERENCES file_logs(id) ON DELETE CASCADE,
+                tag TEXT NOT NULL,
+                PRIMARY KEY (file_id, tag)
+            )
+            """
+            
             # App settings table
             create_settings_table = """
             CREATE TABLE IF NOT EXISTS app_settings (
@@ -103,34 +321,161 @@ class DatabaseManager:
             """
             
             # Create indexes for better performance
-            create_indexes = [
-                "CREATE INDEX IF NOT EXISTS idx_moved_at ON file_logs(moved_at)",
-                "CREATE INDEX IF NOT EXISTS idx_file_type ON file_logs(file_type)",
-                "CREATE INDEX IF NOT EXISTS idx_original_name ON file_logs(original_name)",
+            create_indexes = list(self.BULK_LOAD_INDEXES.values()) + [
                 "CREATE INDEX IF NOT EXISTS idx_setting_key ON app_settings(setting_key)"
             ]
             
-            cursor.execute(create_file_logs_table)
-            cursor.execute(create_settings_table)
-            
-            for index_sql in create_indexes:
-                cursor.execute(index_sql)
-            
-            self.connection.commit()
+            with self._write_lock:
+                cursor.execute(create_file_logs_table)
+                cursor.execute(create_file_tags_table)
+                cursor.execute(create_settings_table)
+                
+                for index_sql in create_indexes:
+                    cursor.execute(index_sql)
+                
+                # Superseded by idx_type_moved and idx_moved_id
+                cursor.execute("DROP INDEX IF EXISTS idx_file_type")
+                cursor.execute("DROP INDEX IF EXISTS idx_moved_at")
+                
+                self._backfill_file_tags(cursor)
+                self._create_filename_index(cursor)
+                self._create_summary_tables(cursor)
+                self.connection.commit()
+                
+                # Give the query planner statistics the first time; later runs
+                # are kept current by PRAGMA optimize on close
+                cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'")
+                if not cursor.fetchone():
+                    cursor.execute("ANALYZE")
+                    self.connection.commit()
             cursor.close()
             
-            print("✅ Database tables initialized successfully")
+            logger.debug("✅ Database tables initialized successfully")
             return True
             
         except sqlite3.Error as e:
-            print(f"❌ Error creating tables: {e}")
+            logger.error(f"❌ Error creating tables: {e}")
             return False
     
+    def _backfill_file_tags(self, cursor: sqlite3.Cursor):
+        """Fill file_tags from the JSON tags of rows logged before it existed."""
+        cursor.execute("SELECT 1 FROM file_tags LIMIT 1")
+        if cursor.fetchone():
+            return
+        
+        # Expand the JSON arrays inside SQLite when json1 is available
+        if sqlite3.sqlite_version_info >= (3, 9, 0):
+            try:
+                cursor.execute("""
+                    INSERT OR IGNORE INTO file_tags (file_id, tag)
+                    SELECT file_logs.id, tag.value
+                    FROM file_logs, json_each(file_logs.tags) AS tag
+                    WHERE file_logs.tags IS NOT NULL AND file_logs.tags != '[]'
+                      AND json_valid(file_logs.tags) AND json_type(file_logs.tags) = 'array'
+                """)
+                return
+            except sqlite3.OperationalError:
+                pass  # built without json1
+        
+        cursor.execute("SELECT id, tags FROM file_logs WHERE tags IS NOT NULL AND tags != '[]'")
+        tag_rows = []
+        for file_id, tags_json in cursor.fetchall():
+            try:
+                tag_rows.extend((file_id, tag) for tag in _json_loads(tags_json))
+            except (ValueError, TypeError):
+                continue
+        
+        if tag_rows:
+            cursor.executemany("INSERT OR IGNORE INTO file_tags (file_id, tag) VALUES (?, ?)", tag_rows)
+    
+    def _create_filename_index(self, cursor: sqlite3.Cursor):
+        """
+        Create the FTS5 index over file_logs.original_name, kept in sync by triggers.
+        
+        Uses the trigram tokenizer (SQLite 3.34+) so any substring of a name can
+        be matched; older versions index whole words. Skipped with a warning if
+        SQLite was built without FTS5.
+        """
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'file_logs_fts'")
+        if cursor.fetchone():
+            return
+        
+        tokenizer = ", tokenize='trigram'" if sqlite3.sqlite_version_info >= (3, 34, 0) else ""
+        try:
+            cursor.execute(f"""
+            CREATE VIRTUAL TABLE file_logs_fts USING fts5(
+                original_name, content='file_logs', content_rowid='id'{tokenizer}
+            )
+            """)
+        except sqlite3.OperationalError as e:
+            logger.warning(f"⚠️ Filename search index unavailable: {e}")
+            return
+        
+        cursor.executescript("""
+        CREATE TRIGGER IF NOT EXISTS file_logs_fts_insert AFTER INSERT ON file_logs BEGIN
+            INSERT INTO file_logs_fts(rowid, original_name) VALUES (new.id, new.original_name);
+        END;
+        CREATE TRIGGER IF NOT EXISTS file_logs_fts_delete AFTER DELETE ON file_logs BEGIN
+            INSERT INTO file_logs_fts(file_logs_fts, rowid, original_name)
+            VALUES ('delete', old.id, old.original_name);
+        END;
+        CREATE TRIGGER IF NOT EXISTS file_logs_fts_update AFTER UPDATE OF original_name ON file_logs BEGIN
+            INSERT INTO file_logs_fts(file_logs_fts, rowid, original_name)
+            VALUES ('delete', old.id, old.original_name);
+            INSERT INTO file_logs_fts(rowid, original_name) VALUES (new.id, new.original_name);
+        END;
+        INSERT INTO file_logs_fts(file_logs_fts) VALUES ('rebuild');
+        """)
+    
+    def _create_summary_tables(self, cursor: sqlite3.Cursor):
+        """
+        Create the per-type and per-day movement counts used by get_statistics.
+        
+        Triggers keep them current on every insert or delete in file_logs, and
+        they are seeded from the existing rows when first created.
+        """
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'file_type_counts'")
+        if cursor.fetchone():
+            return
+        
+        cursor.executescript("""
+        CREATE TABLE IF NOT EXISTS file_type_counts (
+            file_type TEXT PRIMARY KEY,
+            count INTEGER NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS daily_activity (
+            day TEXT PRIMARY KEY,
+            count INTEGER NOT NULL
+        );
+        
+        INSERT INTO file_type_counts (file_type, count)
+            SELECT file_type, COUNT(*) FROM file_logs GROUP BY file_type;
+        INSERT INTO daily_activity (day, count)
+            SELECT DATE(moved_at), COUNT(*) FROM file_logs
+            WHERE moved_at IS NOT NULL GROUP BY DATE(moved_at);
+        
+        CREATE TRIGGER IF NOT EXISTS file_logs_summary_insert AFTER INSERT ON file_logs BEGIN
+            INSERT INTO file_type_counts (file_type, count) VALUES (new.file_type, 1)
+                ON CONFLICT(file_type) DO UPDATE SET count = count + 1;
+            INSERT INTO daily_activity (day, count) VALUES (DATE(new.moved_at), 1)
+                ON CONFLICT(day) DO UPDATE SET count = count + 1;
+        END;
+        CREATE TRIGGER IF NOT EXISTS file_logs_summary_delete AFTER DELETE ON file_logs BEGIN
+            UPDATE file_type_counts SET count = count - 1 WHERE file_type = old.file_type;
+            DELETE FROM file_type_counts WHERE file_type = old.file_type AND count <= 0;
+            UPDATE daily_activity SET count = count - 1 WHERE day = DATE(old.moved_at);
+            DELETE FROM daily_activity WHERE day = DATE(old.moved_at) AND count <= 0;
+        END;
+        """)
+    
     def log_file_movement(self, original_name: str, new_path: str, 
                          file_type: str, file_size: int, tags: List[str]) -> bool:
         """
         Log a file movement to the database.
         
+        The movement is buffered and written together with others once
+        batch_size movements are pending (see batched() and flush()).
+        
         Args:
             original_name (str): Original filename
             new_path (str): New file path after organization
@@ -139,42 +484,300 @@ class DatabaseManager:
             tags (List[str]): List of tags assigned to the file
             
         Returns:
-            bool: True if logged successfully, False otherwise
+            bool: True if logged (or buffered) successfully, False otherwise
         """
-        if not self.connection:
-            if not self.connect():
-                return False
+        # Stamp the movement now, not when a buffered batch is written
+        moved_at = datetime.now().isoformat()
+        with self._buffer_lock:
+            self._pending_logs.append((original_name, new_path, file_type, file_size, tags, moved_at))
+            if len(self._pending_logs) < self.batch_size:
+                return True
+            records = self._pending_logs
+            self._pending_logs = []
         
-        try:
-            cursor = self.connection.cursor()
-            
-            insert_query = """
-            INSERT INTO file_logs (original_name, new_path, file_type, file_size, tags, moved_at)
-            VALUES (?, ?, ?, ?, ?, ?)
-            """
+        return self._write_pending(records)
+    
+    def _write_pending(self, records: List[Tuple]) -> bool:
+        """
+        Write records taken from the buffer.
+        
+        On failure they go back to the front of the buffer, ahead of anything
+        buffered meanwhile, so the next flush retries them.
+        """
+        if self.log_file_movements_batch(records):
+            return True
+        with self._buffer_lock:
+            self._pending_logs[:0] = records
+        return False
+    
+    def log_file_movements_batch(self, records: List[Tuple]) -> bool:
+        """
+        Log several file movements in a single transaction.
+        
+        Args:
+            records (List[Tuple]): (original_name, new_path, file_type, file_size, tags)
+                tuples, optionally followed by an ISO moved_at that defaults to now
             
-            tags_json = json.dumps(tags) if tags else json.dumps([])
-            values = (original_name, new_path, file_type, file_size, tags_json, datetime.now().isoformat())
+        Returns:
+            bool: True if all records were logged, False otherwise
+        """
+        if not records:
+            return True
+        
+        try:
+            now = datetime.now().isoformat()
+            values = [
+                (record[0], record[1], record[2], record[3],
+                 _encode_tags(tuple(record[4])) if record[4] else '[]',
+                 record[5] if len(record) > 5 else now)
+                for record in records
+            ]
             
-            cursor.execute(insert_query, values)
-            self.connection.commit()
-            cursor.close()
+            # One transaction (and one commit) for the whole batch, unless an
+            # enclosing transaction() block commits it later
+            with self._write_lock, self._write_transaction():
+                cursor = self._get_write_cursor()
+                if (self._bulk_depth and not self._bulk_dropped
+                        and len(values) >= self.BULK_LOAD_MIN_ROWS):
+                    for index_name in self.BULK_LOAD_INDEXES:
+                        cursor.execute(f"DROP INDEX IF EXISTS {index_name}")
+                    self._bulk_dropped = True
+                
+                if self.HAS_RETURNING:
+                    file_ids = self._insert_returning_ids(cursor, values)
+                else:
+                    if len(values) == 1:
+                        cursor.execute(self._INSERT_SQL, values[0])
+                    elif len(values) <= self.MULTI_ROW_LIMIT:
+                        cursor.execute(
+                            self._multi_row_insert_sql(len(values)),
+                            [value for row in values for value in row]
+                        )
+                    else:
+                        cursor.executemany(self._INSERT_SQL, values)
+                    
+                    # The batch got consecutive ids ending at last_insert_rowid(),
+                    # since the write lock and transaction keep other inserts out
+                    cursor.execute("SELECT last_insert_rowid()")
+                    last_id = cursor.fetchone()[0]
+                    file_ids = range(last_id - len(values) + 1, last_id + 1)
+                
+                tag_rows = [
+                    (file_id, tag)
+                    for file_id, record in zip(file_ids, records)
+                    for tag in (record[4] or [])
+                ]
+                if tag_rows:
+                    cursor.executemany(
+                        "INSERT OR IGNORE INTO file_tags (file_id, tag) VALUES (?, ?)", tag_rows
+                    )
             
-            print(f"✅ Logged file movement: {original_name} → {new_path}")
+            if len(records) == 1:
+                logger.debug("✅ Logged file movement: %s → %s", records[0][0], records[0][1])
+            else:
+                logger.debug("✅ Logged %d file movements", len(records))
             return True
             
         except sqlite3.Error as e:
-            print(f"❌ Error logging file movement: {e}")
+            logger.error(f"❌ Error logging file movement: {e}")
             return False
     
+    @contextmanager
+    def _write_transaction(self):
+        """
+        Make a write atomic; call with the write lock held.
+        
+        Outside transaction() the write is committed on its own. Inside one it
+        runs in a savepoint, so a failed write is undone without aborting the
+        enclosing block, and is committed with it.
+        """
+        connection = self._writer()
+        if not self._txn_depth:
+            with connection:
+                yield
+            return
+        
+        connection.execute("SAVEPOINT write_batch")
+        try:
+            yield
+        except BaseException:
+            connection.execute("ROLLBACK TO write_batch")
+            connection.execute("RELEASE write_batch")
+            raise
+        connection.execute("RELEASE write_batch")
+    
+    @contextmanager
+    def transaction(self):
+        """
+        Commit every write made inside the block once, when the block exits.
+        
+        The write lock is held for the whole block, so writes from other threads
+        wait for it rather than joining (or being rolled back with) this
+        transaction; don't wait inside the block on threads that write. Blocks
+        may be nested as savepoints; the outermost one commits, or rolls back
+        if it raises. Buffered file movements are flushed before the commit.
+        """
+        with self._write_lock:
+            if self._txn_depth:
+                with self._write_transaction():
+                    yield self.connection
+                    self.flush()
+                return
+            
+            connection = self._writer()
+            if not connection.in_transaction:
+                connection.execute("BEGIN")
+            self._txn_depth = 1
+            self._txn_owner = threading.get_ident()
+            try:
+                yield self.connection
+                self.flush()
+            except BaseException:
+                self._txn_depth = 0
+                self._txn_owner = None
+                self._settings_dirty = False
+                if self.connection is not None:
+                    self.connection.rollback()
+                raise
+            self._txn_depth = 0
+            self._txn_owner = None
+            if self.connection is not None:
+                self.connection.commit()
+            self._commit_settings()
+    
+    def _commit_settings(self):
+        """Move get_setting to a new generation if committed writes changed settings."""
+        if self._settings_dirty:
+            self._settings_dirty = False
+            self._settings_gen += 1
+    
+    @contextmanager
+    def bulk_load(self):
+        """
+        Defer secondary index maintenance for a large run of logged movements.
+        
+        The first batch of at least BULK_LOAD_MIN_ROWS written inside the block
+        drops BULK_LOAD_INDEXES; when the block exits, buffered movements are
+        flushed and the indexes are rebuilt in one pass and re-analyzed.
+        """
+        with self._write_lock:
+            self._bulk_depth += 1
+        try:
+            yield self
+        finally:
+            self.flush()
+            with self._write_lock:
+                self._bulk_depth -= 1
+                if not self._bulk_depth and self._bulk_dropped:
+                    try:
+                        with self._write_transaction():
+                            cursor = self._get_write_cursor()
+                            for index_sql in self.BULK_LOAD_INDEXES.values():
+                                cursor.execute(index_sql)
+                            cursor.execute("ANALYZE file_logs")
+                        self._bulk_dropped = False
+                    except sqlite3.Error as e:
+                        # initialize_tables recreates any index still missing
+                        logger.error(f"❌ Error rebuilding indexes: {e}")
+    
+    def _get_write_cursor(self) -> sqlite3.Cursor:
+        """Return the cursor reused for writes on the writer connection."""
+        connection = self._writer()
+        if self._write_cursor is None or self._write_cursor.connection is not connection:
+            self._write_cursor = connection.cursor()
+        return self._write_cursor
+    
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _multi_row_insert_sql(row_count: int, returning: bool = False) -> str:
+        """Build an INSERT into file_logs with row_count VALUES groups."""
+        head, values = DatabaseManager._INSERT_SQL.split("VALUES ")
+        sql = head + "VALUES " + ", ".join([values] * row_count)
+        return sql + " RETURNING id" if returning else sql
+    
+    def _insert_returning_ids(self, cursor: sqlite3.Cursor, values: List[Tuple]) -> List[int]:
+        """
+        Insert file_logs rows in multi-row statements and return their ids.
+        
+        RETURNING does not promise an order, but rows are assigned increasing
+        ids in VALUES order, so each statement's sorted ids line up with values.
+        """
+        file_ids = []
+        for start in range(0, len(values), self.MULTI_ROW_LIMIT):
+            chunk = values[start:start + self.MULTI_ROW_LIMIT]
+            cursor.execute(
+                self._multi_row_insert_sql(len(chunk), True),
+                [value for row in chunk for value in row]
+            )
+            file_ids.extend(sorted(row[0] for row in cursor.fetchall()))
+        return file_ids
+    
+    def flush(self) -> bool:
+        """
+        Write any buffered file movements.
+        
+        Returns:
+            bool: True if the buffer was written (or empty), False otherwise
+        """
+        with self._buffer_lock:
+            records = self._pending_logs
+            self._pending_logs = []
+        return self._write_pending(records)
+    
+    @contextmanager
+    def batched(self, batch_size: int = 1000):
+        """
+        Buffer file movements in batches of batch_size for the duration of the block.
+        
+        Blocks may overlap, from one thread or several: the largest requested
+        size applies while any is open, and the manager's own batch_size comes
+        back when the last one exits. Anything still buffered is written when
+        each block exits.
+        """
+        with self._buffer_lock:
+            if not self._batched_depth:
+                self._base_batch_size = self.batch_size
+            self._batched_depth += 1
+            self.batch_size = max(self.batch_size, batch_size)
+        try:
+            yield self
+        finally:
+            with self._buffer_lock:
+                self._batched_depth -= 1
+                if not self._batched_depth:
+                    self.batch_size = self._base_batch_size
+            self.flush()
+    
     def get_file_logs(self, limit: int = 100, offset: int = 0, 
                      file_type: Optional[str] = None, 
                      tag_filter: Optional[str] = None,
                      date_from: Optional[datetime] = None,
-                     date_to: Optional[datetime] = None) -> List[Dict]:
+                     date_to: Optional[datetime] = None,
+                     before: Optional[Tuple[str, int]] = None) -> List[Dict]:
         """
         Retrieve file movement logs with optional filtering.
         
+        Takes the same arguments as iter_file_logs and collects its rows.
+        
+        Returns:
+            List[Dict]: List of file log records
+        """
+        return list(self.iter_file_logs(limit, offset, file_type, tag_filter,
+                                        date_from, date_to, before))
+    
+    def iter_file_logs(self, limit: int = 100, offset: int = 0, 
+                       file_type: Optional[str] = None, 
+                       tag_filter: Optional[str] = None,
+                       date_from: Optional[datetime] = None,
+                       date_to: Optional[datetime] = None,
+                       before: Optional[Tuple[str, int]] = None) -> Iterator[Dict]:
+        """
+        Stream file movement logs with optional filtering.
+        
+        Pages are walked with the before cursor (the (moved_at, id) of the
+        last row already seen), which seeks straight into the index; offset
+        still works but has to skip every earlier row.
+        
         Args:
             limit (int): Maximum number of records to return
             offset (int): Number of records to skip
@@ -182,61 +785,134 @@ class DatabaseManager:
             tag_filter (str, optional): Filter by specific tag
             date_from (datetime, optional): Filter from date
             date_to (datetime, optional): Filter to date
+            before (tuple, optional): Only return rows older than this
+                (moved_at, id) cursor
             
-        Returns:
-            List[Dict]: List of file log records
+        Yields:
+            Dict: One file log record at a time
         """
-        if not self.connection:
-            if not self.connect():
-                return []
+        conn = self._get_conn()
+        if conn is None:
+            return
         
+        cursor = None
         try:
-            cursor = self.connection.cursor()
+            cursor = conn.cursor()
             
-            # Base query
-            query = "SELECT * FROM file_logs WHERE 1=1"
             params = []
-            
-            # Add filters
             if file_type:
-                query += " AND file_type = ?"
                 params.append(file_type)
-            
             if tag_filter:
-                query += " AND tags LIKE ?"
-                params.append(f'%"{tag_filter}"%')
-            
+                params.append(tag_filter)
             if date_from:
-                query += " AND moved_at >= ?"
                 params.append(date_from.isoformat())
-            
             if date_to:
-                query += " AND moved_at <= ?"
                 params.append(date_to.isoformat())
+            if before:
+                params.extend(before)
+            params.append(limit)
+            if offset:
+                params.append(offset)
             
-            query += " ORDER BY moved_at DESC LIMIT ? OFFSET ?"
-            params.extend([limit, offset])
+            active = (bool(file_type), bool(tag_filter), bool(date_from),
+                      bool(date_to), bool(before), bool(offset))
+            cursor.execute(self._log_query(active), params)
+            yield from self._iter_logs(cursor)
             
-            cursor.execute(query, params)
-            results = cursor.fetchall()
+        except sqlite3.Error as e:
+            logger.error(f"❌ Error retrieving file logs: {e}")
+        finally:
+            if cursor is not None:
+                cursor.close()
+    
+    @classmethod
+    def _log_query(cls, active: Tuple[bool, ...]) -> str:
+        """Return the get_file_logs SQL for a tuple of active-filter flags."""
+        query = cls._LOG_QUERIES.get(active)
+        if query is None:
+            *filters, has_offset = active
+            query = (
+                _SELECT_LOGS + " WHERE 1=1"
+                + "".join(sql for sql, on in zip(cls._LOG_FILTER_SQL, filters) if on)
+                + " ORDER BY moved_at DESC, id DESC LIMIT ?"
+                + (" OFFSET ?" if has_offset else "")
+            )
+            cls._LOG_QUERIES[active] = query
+        return query
+    
+    def get_file_logs_page(self, limit: int = 100,
+                           before: Optional[Tuple[str, int]] = None,
+                           **filters) -> Dict:
+        """
+        Retrieve one page of file logs plus the cursor for the next page.
+        
+        Args:
+            limit (int): Maximum number of records to return
+            before (tuple, optional): next_cursor from the previous page
+            **filters: file_type, tag_filter, date_from, date_to
             
-            # Convert to list of dictionaries
-            columns = [description[0] for description in cursor.description]
-            logs = []
-            for row in results:
-                log_entry = dict(zip(columns, row))
-                # Parse JSON tags back to lists
-                if log_entry['tags']:
-                    log_entry['tags'] = json.loads(log_entry['tags'])
-                else:
-                    log_entry['tags'] = []
-                logs.append(log_entry)
+        Returns:
+            Dict: {'logs': [...], 'next_cursor': (moved_at, id) or None}
+        """
+        logs = self.get_file_logs(limit=limit, before=before, **filters)
+        next_cursor = None
+        if len(logs) == limit and logs:
+            next_cursor = (logs[-1]['moved_at'], logs[-1]['id'])
+        return {'logs': logs, 'next_cursor': next_cursor}
+    
+    def _iter_logs(self, cursor: sqlite3.Cursor) -> Iterator[Dict]:
+        """Yield the rows of an executed _SELECT_LOGS query as dictionaries."""
+        for rows in iter(lambda: cursor.fetchmany(256), []):
+            yield from map(_row_to_dict, rows)
+    
+    def search_filenames(self, query: str, limit: int = 100) -> List[Dict]:
+        """
+        Find logged files whose original name contains query.
+        
+        Uses the file_logs_fts index when it exists; with the trigram tokenizer
+        queries shorter than three characters, and databases without the index,
+        fall back to a LIKE scan.
+        
+        Args:
+            query (str): Text to look for in file names
+            limit (int): Maximum number of records to return
             
+        Returns:
+            List[Dict]: Matching file log records, newest first
+        """
+        conn = self._get_conn()
+        if conn is None:
+            return []
+        
+        try:
+            cursor = conn.cursor()
+            
+            cursor.execute("SELECT sql FROM sqlite_master WHERE name = 'file_logs_fts'")
+            fts = cursor.fetchone()
+            trigram = fts is not None and 'trigram' in fts[0]
+            
+            if fts is not None and (len(query) >= 3 or not trigram):
+                # Quote the text so FTS5 treats it as a phrase, not query syntax
+                phrase = '"' + query.replace('"', '""') + '"'
+                if not trigram:
+                    phrase += '*'
+                cursor.execute(_SELECT_LOGS + """
+                    WHERE id IN (SELECT rowid FROM file_logs_fts WHERE file_logs_fts MATCH ?)
+                    ORDER BY moved_at DESC LIMIT ?
+                """, (phrase, limit))
+            else:
+                pattern = '%' + query.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+                cursor.execute(_SELECT_LOGS + """
+                    WHERE original_name LIKE ? ESCAPE '\\'
+                    ORDER BY moved_at DESC LIMIT ?
+                """, (pattern, limit))
+            
+            logs = list(self._iter_logs(cursor))
             cursor.close()
             return logs
             
         except sqlite3.Error as e:
-            print(f"❌ Error retrieving file logs: {e}")
+            logger.error(f"❌ Error searching file names: {e}")
             return []
     
     def get_statistics(self) -> Dict:
@@ -246,73 +922,53 @@ class DatabaseManager:
         Returns:
             Dict: Statistics including total files, files by type, recent activity
         """
-        if not self.connection:
-            if not self.connect():
-                return {}
+        conn = self._get_conn()
+        if conn is None:
+            return {}
         
         try:
-            cursor = self.connection.cursor()
+            cursor = conn.cursor()
             
             stats = {}
             
-            # Total files moved
-            cursor.execute("SELECT COUNT(*) FROM file_logs")
-            stats['total_files'] = cursor.fetchone()[0]
-            
-            # Files by type
+            # Files by type, from the running totals
             cursor.execute("""
-                SELECT file_type, COUNT(*) as count 
-                FROM file_logs 
-                GROUP BY file_type 
+                SELECT file_type, count
+                FROM file_type_counts
                 ORDER BY count DESC
             """)
-            results = cursor.fetchall()
-            stats['by_type'] = [{'file_type': row[0], 'count': row[1]} for row in results]
+            by_type = [{'file_type': row[0], 'count': row[1]} for row in cursor.fetchall()]
+            
+            # Total files moved
+            stats['total_files'] = sum(entry['count'] for entry in by_type)
+            stats['by_type'] = by_type
             
             # Recent activity (last 7 days)
             cursor.execute("""
-                SELECT DATE(moved_at) as date, COUNT(*) as count
-                FROM file_logs 
-                WHERE moved_at >= DATE('now', '-7 days')
-                GROUP BY DATE(moved_at)
-                ORDER BY date DESC
+                SELECT day as date, count
+                FROM daily_activity
+                WHERE day >= DATE('now', '-7 days')
+                ORDER BY day DESC
             """)
             results = cursor.fetchall()
             stats['recent_activity'] = [{'date': row[0], 'count': row[1]} for row in results]
             
-            # Most common tags (simplified for SQLite)
+            # Most common tags
             cursor.execute("""
-                SELECT tags, COUNT(*) as count
-                FROM file_logs 
-                WHERE tags IS NOT NULL AND tags != '[]'
-                GROUP BY tags
+                SELECT tag, COUNT(*) as count
+                FROM file_tags
+                GROUP BY tag
                 ORDER BY count DESC
                 LIMIT 10
             """)
             results = cursor.fetchall()
-            
-            # Process tags to extract individual tags
-            tag_counts = {}
-            for row in results:
-                try:
-                    tags_list = json.loads(row[0])
-                    for tag in tags_list:
-                        if tag in tag_counts:
-                            tag_counts[tag] += row[1]
-                        else:
-                            tag_counts[tag] = row[1]
-                except:
-                    continue
-            
-            # Sort and format popular tags
-            popular_tags = sorted(tag_counts.items(), key=lambda x: x[1], reverse=True)[:10]
-            stats['popular_tags'] = [{'tag': tag, 'count': count} for tag, count in popular_tags]
+            stats['popular_tags'] = [{'tag': row[0], 'count': row[1]} for row in results]
             
             cursor.close()
             return stats
             
         except sqlite3.Error as e:
-            print(f"❌ Error retrieving statistics: {e}")
+            logger.error(f"❌ Error retrieving statistics: {e}")
             return {}
     
     def save_setting(self, key: str, value) -> bool:
@@ -326,12 +982,8 @@ class DatabaseManager:
         Returns:
             bool: True if saved successfully
         """
-        if not self.connection:
-            if not self.connect():
-                return False
-        
         try:
-            cursor = self.connection.cursor()
+            cursor = self._writer().cursor()
             
             # SQLite UPSERT
             query = """
@@ -339,13 +991,20 @@ class DatabaseManager:
             VALUES (?, ?, CURRENT_TIMESTAMP)
             """
             
-            cursor.execute(query, (key, json.dumps(value)))
-            self.connection.commit()
+            with self._write_lock:
+                with self._write_transaction():
+                    cursor.execute(query, (key, _json_dumps(value)))
+                # Readers on other connections only see the value once it is
+                # committed, so don't move them to a new generation before then
+                if self._txn_depth:
+                    self._settings_dirty = True
+                else:
+                    self._settings_gen += 1
             cursor.close()
             return True
             
         except sqlite3.Error as e:
-            print(f"❌ Error saving setting: {e}")
+            logger.error(f"❌ Error saving setting: {e}")
             return False
     
     def get_setting(self, key: str, default_value=None):
@@ -359,40 +1018,67 @@ class DatabaseManager:
         Returns:
             Setting value or default_value
         """
-        if not self.connection:
-            if not self.connect():
-                return default_value
-        
         try:
-            cursor = self.connection.cursor()
-            
-            cursor.execute("SELECT setting_value FROM app_settings WHERE setting_key = ?", (key,))
-            result = cursor.fetchone()
-            
-            cursor.close()
-            
-            if result:
-                return json.loads(result[0])
-            return default_value
-            
+            if self._txn_owner == threading.get_ident():
+                # Inside this thread's transaction(): read its uncommitted writes
+                cursor = self.connection.execute(
+                    "SELECT setting_value FROM app_settings WHERE setting_key = ?", (key,)
+                )
+                result = cursor.fetchone()
+                setting_json = result[0] if result else None
+            else:
+                setting_json = self._get_setting_cached(key, self._settings_gen)
         except sqlite3.Error as e:
-            print(f"❌ Error getting setting: {e}")
+            logger.error(f"❌ Error getting setting: {e}")
             return default_value
+        
+        # Decoded per call so callers can't mutate a cached value
+        if setting_json is not None:
+            return _json_loads(setting_json)
+        return default_value
+    
+    def _get_setting_cached(self, key: str, generation: int) -> Optional[str]:
+        """Read a setting's JSON text; memoized per (key, generation) in __init__."""
+        conn = self._get_conn()
+        if conn is None:
+            raise sqlite3.OperationalError("no database connection")
+        
+        cursor = conn.cursor()
+        cursor.execute("SELECT setting_value FROM app_settings WHERE setting_key = ?", (key,))
+        result = cursor.fetchone()
+        cursor.close()
+        
+        return result[0] if result else None
     
     def close_connection(self):
-        """Close database connection."""
+        """Close database connection, writing any buffered file movements first."""
+        with self._pool_lock:
+            readers = list(self._read_connections)
+            self._read_connections.clear()
+        for reader in readers:
+            reader.close()
+        
         if self.connection:
-            self.connection.close()
-            print("🔌 Database connection closed")
+            with self._write_lock:
+                self.flush()
+                # Keep writes from a still-open transaction() block
+                self.connection.commit()
+                self._commit_settings()
+                try:
+                    self.connection.execute("PRAGMA optimize")
+                except sqlite3.Error:
+                    pass
+                self.connection.close()
+                self.connection = None
+            logger.debug("🔌 Database connection closed")
 
 
 # Test function
 if __name__ == "__main__":
-    db = DatabaseManager()
-    db.create_database_if_not_exists()
-    
-    if db.connect():
+    try:
+        db = DatabaseManager()
+    except sqlite3.Error:
+        print("Failed to setup database")
+    else:
         db.initialize_tables()
         print("Database setup completed successfully!")
-    else:
-        print("Failed to setup database")